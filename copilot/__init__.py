@@ -34,43 +34,75 @@ bl_info = {
 }
 
 import bpy
+from importlib import import_module
 
-# Import add-on modules
-from .operators import lighting
-from .operators import modifier_assistant
-from .panels import lighting_panel
-from .panels import modifier_panel
-from .props import modifier_preferences
-from . import preferences
+# Classes to register as (module path, class name), resolved in register().
+# This defers importing the operator and panel modules from package import
+# to registration; register() still imports all of them when the add-on is
+# enabled.
+_CLASS_PATHS = (
+    (".operators.lighting", "COPILOT_OT_create_three_point_lighting"),
+    (".panels.lighting_panel", "COPILOT_PT_lighting_panel"),
+    (".operators.modifier_assistant", "COPILOT_OT_modifier_assistant"),
+    (".panels.modifier_panel", "COPILOT_PT_modifier_assistant"),
+    (".panels.modifier_panel", "COPILOT_PT_modifier_selection_info"),
+)
 
-# Classes to register
-classes = [
-    lighting.COPILOT_OT_create_three_point_lighting,
-    lighting_panel.COPILOT_PT_lighting_panel,
-    modifier_assistant.COPILOT_OT_modifier_assistant,
-    modifier_panel.COPILOT_PT_modifier_assistant,
-]
+_unregister_classes = None
+
+def _resolve_classes():
+    """Import add-on modules and return the classes to register"""
+    return [
+        getattr(import_module(module_path, __package__), class_name)
+        for module_path, class_name in _CLASS_PATHS
+    ]
 
 def register():
     """Register all add-on classes and components"""
+    global _unregister_classes
+    
+    from . import preferences
+    from .props import modifier_preferences
+    from .panels import lighting_panel, modifier_panel
+    from .utils import geometry
+    
     # Register preferences first (needed by other components)
     preferences.register()
     
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    register_classes, _unregister_classes = bpy.utils.register_classes_factory(
+        _resolve_classes()
+    )
+    register_classes()
     
     # Register modifier assistant properties
     modifier_preferences.register()
     
+    # Register cache invalidation handlers
+    geometry.register()
+    lighting_panel.register()
+    modifier_panel.register()
+    
     print("Blender Copilot: Three-Point Lighting add-on registered")
 
 def unregister():
     """Unregister all add-on classes and components"""
+    global _unregister_classes
+    
+    from . import preferences
+    from .props import modifier_preferences
+    from .panels import lighting_panel, modifier_panel
+    from .utils import geometry
+    
+    modifier_panel.unregister()
+    lighting_panel.unregister()
+    geometry.unregister()
+    
     # Unregister modifier assistant properties
     modifier_preferences.unregister()
     
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    if _unregister_classes is not None:
+        _unregister_classes()
+        _unregister_classes = None
     
     # Unregister preferences last
     preferences.unregister()
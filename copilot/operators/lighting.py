@@ -25,21 +25,22 @@ Requirements:
     - Object type must be MESH, CURVE, SURFACE, META, or FONT
 """
 
+import logging
+
 import bpy
-import mathutils
-from typing import Set, Tuple, Dict, Any, Optional
 from bpy.types import Operator
 from bpy.props import FloatProperty
 
-from ..utils.validation import validate_target_object
-from ..utils.geometry import analyze_bounding_box, calculate_light_position
-from ..utils.blender_helpers import (
-    create_area_light, create_target_empty, add_track_to_constraint,
-    create_lighting_collection, move_object_to_collection,
-    generate_unique_name
-)
-from ..utils.light_defaults import (
-    LIGHT_DEFAULTS, LIGHT_NAMES, TARGET_EMPTY_NAME, COLLECTION_NAME_PREFIX
+logger = logging.getLogger(__name__)
+
+# Utility modules (and NumPy behind them) are imported inside the operator
+# methods so that registering the add-on at startup stays cheap.
+
+# Rig build order: light type paired with the operator property holding its angle
+_LIGHT_SPECS = (
+    ('KEY', 'key_angle'),
+    ('FILL', 'fill_angle'),
+    ('RIM', 'rim_angle'),
 )
 
 
@@ -86,6 +87,17 @@ class COPILOT_OT_create_three_point_lighting(Operator):
 
     def execute(self, context):
         """Main execution method for the lighting operator"""
+        from ..utils.validation import validate_target_object
+        from ..utils.geometry import analyze_bounding_box
+        from ..utils.blender_helpers import (
+            create_target_empty, create_lighting_collection, generate_unique_name
+        )
+        from ..utils.light_defaults import TARGET_EMPTY_NAME, COLLECTION_NAME_PREFIX
+        
+        # Track created data up front so cleanup is always safe
+        created_objects = []
+        lighting_collection = None
+        
         try:
             # Validate target object
             target_obj = context.active_object
@@ -114,95 +126,68 @@ class COPILOT_OT_create_three_point_lighting(Operator):
             target_empty_name = generate_unique_name(
                 f"{TARGET_EMPTY_NAME}_{target_obj.name}"
             )
-            target_empty = create_target_empty(target_empty_name, target_center)
-            move_object_to_collection(target_empty, lighting_collection)
+            target_empty = create_target_empty(
+                target_empty_name, target_center, collection=lighting_collection
+            )
+            created_objects.append(target_empty)
             
-            # Store created objects for potential cleanup on error
-            created_objects = [target_empty]
+            # Create lights based on configuration
+            self._create_lighting_rig(
+                target_center, object_radius, target_empty, 
+                lighting_collection, created_objects
+            )
+            
+            # Report success
+            self.report({'INFO'}, f"Created three-point lighting rig for '{target_obj.name}'")
+            return {'FINISHED'}
             
-            try:
-                # Create lights based on configuration
-                lights_created = self._create_lighting_rig(
-                    target_center, object_radius, target_empty, 
-                    lighting_collection, created_objects
-                )
-                
-                if not lights_created:
-                    self._cleanup_on_error(created_objects, lighting_collection)
-                    self.report({'ERROR'}, "Failed to create lighting rig")
-                    return {'CANCELLED'}
-                
-                # Report success
-                self.report({'INFO'}, f"Created three-point lighting rig for '{target_obj.name}'")
-                return {'FINISHED'}
-                
-            except Exception as e:
-                # Cleanup on error
-                self._cleanup_on_error(created_objects, lighting_collection)
-                self.report({'ERROR'}, f"Error creating lighting rig: {str(e)}")
-                return {'CANCELLED'}
-                
         except Exception as e:
-            self.report({'ERROR'}, f"Unexpected error: {str(e)}")
+            # Cleanup on error
+            self._cleanup_on_error(created_objects, lighting_collection)
+            self.report({'ERROR'}, f"Error creating lighting rig: {e!s}")
             return {'CANCELLED'}
     
     def _create_lighting_rig(self, target_center, object_radius, target_empty, 
                             lighting_collection, created_objects):
         """Create the three lights with proper positioning and constraints"""
+        from ..utils.geometry import spherical_trig, spherical_to_cartesian_precomputed
+        from ..utils.blender_helpers import (
+            create_area_light, add_track_to_constraint, generate_unique_name
+        )
+        from ..utils.light_defaults import LIGHT_DEFAULTS, LIGHT_NAMES
         
-        # Light configurations with custom angles
-        light_configs = {
-            'KEY': {
-                **LIGHT_DEFAULTS['KEY'],
-                'horizontal_angle': self.key_angle
-            },
-            'FILL': {
-                **LIGHT_DEFAULTS['FILL'], 
-                'horizontal_angle': self.fill_angle
-            },
-            'RIM': {
-                **LIGHT_DEFAULTS['RIM'],
-                'horizontal_angle': self.rim_angle
-            }
-        }
-        
-        lights_created = 0
-        
-        for light_type, config in light_configs.items():
-            try:
-                # Calculate light position
-                distance = object_radius * config['distance_multiplier'] * self.distance_scale
-                light_pos = calculate_light_position(
-                    target_center,
-                    config['horizontal_angle'],
-                    config['vertical_angle'],
-                    distance
-                )
-                
-                # Create light
-                light_name = generate_unique_name(LIGHT_NAMES[light_type])
-                light_obj = create_area_light(
-                    light_name,
-                    light_pos,
-                    config['power_watts'],
-                    config['color_temperature'],
-                    config['size']
-                )
-                
-                # Add track-to constraint
-                add_track_to_constraint(light_obj, target_empty)
-                
-                # Move to collection
-                move_object_to_collection(light_obj, lighting_collection)
-                created_objects.append(light_obj)
-                
-                lights_created += 1
-                
-            except Exception as e:
-                print(f"Error creating {light_type} light: {e}")
-                continue
+        center_x, center_y, center_z = target_center
         
-        return lights_created == 3
+        # Errors propagate to execute(), which cleans up the partial rig
+        for light_type, angle_attr in _LIGHT_SPECS:
+            config = LIGHT_DEFAULTS[light_type]
+            horizontal_angle = getattr(self, angle_attr)
+            
+            # Default angles reuse the trig precomputed in LIGHT_DEFAULTS
+            if horizontal_angle == config.horizontal_angle:
+                trig = config.trig
+            else:
+                trig = spherical_trig(horizontal_angle, config.vertical_angle)
+            
+            distance = object_radius * config.distance_multiplier * self.distance_scale
+            offset_x, offset_y, offset_z = spherical_to_cartesian_precomputed(distance, trig)
+            light_pos = (center_x + offset_x, center_y + offset_y, center_z + offset_z)
+            
+            # Create light
+            light_name = generate_unique_name(LIGHT_NAMES[light_type])
+            light_obj = create_area_light(
+                light_name,
+                light_pos,
+                config.power_watts,
+                config.color_temperature,
+                config.size,
+                collection=lighting_collection
+            )
+            created_objects.append(light_obj)
+            
+            # Add track-to constraint
+            add_track_to_constraint(light_obj, target_empty)
+            logger.debug("Created %s light '%s'", light_type, light_obj.name)
     
     def _cleanup_on_error(self, created_objects, collection):
         """Clean up created objects if operation fails"""
@@ -218,22 +203,10 @@ class COPILOT_OT_create_three_point_lighting(Operator):
                     bpy.data.collections.remove(collection)
                     
         except Exception as e:
-            print(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
 
     @classmethod
     def poll(cls, context):
         """Check if operator can be executed in current context"""
         return (context.active_object is not None and 
                 context.mode == 'OBJECT')
-
-
-def register():
-    bpy.utils.register_class(COPILOT_OT_create_three_point_lighting)
-
-
-def unregister():
-    bpy.utils.unregister_class(COPILOT_OT_create_three_point_lighting)
-
-
-if __name__ == "__main__":
-    register()
\ No newline at end of file
@@ -37,6 +37,16 @@ class COPILOT_OT_modifier_assistant(bpy.types.Operator):
     bl_label = "Apply Modifier Workflow"
     bl_options = {'REGISTER', 'UNDO'}
 
+    # Workflow dispatch table: workflow type -> handler(self, selected, active)
+    _ROUTES = {
+        'SMART_ARRAY': lambda self, selected, active: self._execute_smart_array(selected),
+        'HARD_SURFACE': lambda self, selected, active: modifier_workflows.apply_hard_surface_setup(active),
+        'SYMMETRIZE': lambda self, selected, active: modifier_workflows.apply_symmetrize(active),
+        'CURVE_DEFORM': lambda self, selected, active: self._execute_curve_deform(selected),
+        'SOLIDIFY': lambda self, selected, active: modifier_workflows.apply_solidify(active),
+        'SHRINKWRAP': lambda self, selected, active: self._execute_shrinkwrap(selected, active),
+    }
+
     def execute(self, context):
         """Execute the modifier assistant workflow.
 
@@ -57,6 +67,10 @@ class COPILOT_OT_modifier_assistant(bpy.types.Operator):
             feedback.report_to_user(self, 'ERROR', feedback.ERROR_COMMAND_EMPTY)
             return {'CANCELLED'}
 
+        # Snapshot selection once; each RNA access builds a new list
+        selected = list(context.selected_objects)
+        active = context.active_object
+
         # Step 2: Parse command to identify workflow
         workflow_type = parse_command(command_text)
 
@@ -65,14 +79,14 @@ class COPILOT_OT_modifier_assistant(bpy.types.Operator):
             return {'CANCELLED'}
 
         # Step 3: Validate context for workflow
-        is_valid, error_message = validate_context(workflow_type)
+        is_valid, error_message = validate_context(workflow_type, selected, active)
 
         if not is_valid:
             self.report({'ERROR'}, error_message)
             return {'CANCELLED'}
 
         # Step 4: Execute workflow
-        status, message = self._execute_workflow(workflow_type, context)
+        status, message = self._execute_workflow(workflow_type, selected, active)
 
         # Step 5: Report result
         if status == {'FINISHED'}:
@@ -82,68 +96,54 @@ class COPILOT_OT_modifier_assistant(bpy.types.Operator):
 
         return status
 
-    def _execute_workflow(self, workflow_type: str, context) -> tuple[set, str]:
+    def _execute_workflow(self, workflow_type: str, selected, active) -> tuple[set, str]:
         """Route to appropriate workflow execution function.
 
         Args:
             workflow_type: Identified workflow identifier
-            context: Blender context with selection
+            selected: Snapshot of the selected objects
+            active: Active object
 
         Returns:
             Tuple of (status, message)
         """
-        selected = context.selected_objects
-        active = context.active_object
-
         # Route to workflow implementations
-        if workflow_type == 'SMART_ARRAY':
-            return self._execute_smart_array(selected, active)
-
-        elif workflow_type == 'HARD_SURFACE':
-            return modifier_workflows.apply_hard_surface_setup(active)
-
-        elif workflow_type == 'SYMMETRIZE':
-            return modifier_workflows.apply_symmetrize(active)
-
-        elif workflow_type == 'CURVE_DEFORM':
-            return self._execute_curve_deform(selected)
-
-        elif workflow_type == 'SOLIDIFY':
-            return modifier_workflows.apply_solidify(active)
-
-        elif workflow_type == 'SHRINKWRAP':
-            return self._execute_shrinkwrap(selected, active)
-
-        else:
+        route = self._ROUTES.get(workflow_type)
+        if route is None:
             error_msg = feedback.format_message(
                 feedback.ERROR_WORKFLOW_NOT_IMPLEMENTED,
                 workflow_type=workflow_type
             )
             return {'CANCELLED'}, error_msg
 
-    def _execute_smart_array(self, selected, active) -> tuple[set, str]:
+        return route(self, selected, active)
+
+    def _execute_smart_array(self, selected) -> tuple[set, str]:
         """Execute Smart Array workflow (handles both variants)."""
-        if len(selected) == 1:
-            # Single object variant
-            return modifier_workflows.apply_smart_array_single(active)
-        else:
-            # Object offset variant (mesh + empty)
-            mesh_obj, empty_obj = modifier_workflows.identify_mesh_and_empty(
-                selected[0], selected[1]
-            )
-            if mesh_obj is None:
-                error_msg = feedback.format_message(
-                    feedback.ERROR_OBJECT_IDENTIFICATION_FAILED,
-                    expected_types="mesh and empty"
-                )
-                return {'CANCELLED'}, error_msg
-            return modifier_workflows.apply_smart_array_controlled(mesh_obj, empty_obj)
+        match selected:
+            case [only]:
+                # Single object variant
+                return modifier_workflows.apply_smart_array_single(only)
+            case [first, second, *_]:
+                # Object offset variant (mesh + empty)
+                mesh_obj, empty_obj = modifier_workflows.identify_mesh_and_empty(first, second)
+                if mesh_obj is None:
+                    error_msg = feedback.format_message(
+                        feedback.ERROR_OBJECT_IDENTIFICATION_FAILED,
+                        expected_types="mesh and empty"
+                    )
+                    return {'CANCELLED'}, error_msg
+                return modifier_workflows.apply_smart_array_controlled(mesh_obj, empty_obj)
+            case _:
+                return {'CANCELLED'}, feedback.ERROR_NO_SELECTION
 
     def _execute_curve_deform(self, selected) -> tuple[set, str]:
         """Execute Curve Deform workflow."""
-        mesh_obj, curve_obj = modifier_workflows.identify_mesh_and_curve(
-            selected[0], selected[1]
-        )
+        match selected:
+            case [first, second, *_]:
+                mesh_obj, curve_obj = modifier_workflows.identify_mesh_and_curve(first, second)
+            case _:
+                mesh_obj = None
         if mesh_obj is None:
             error_msg = feedback.format_message(
                 feedback.ERROR_OBJECT_IDENTIFICATION_FAILED,
@@ -155,16 +155,5 @@ class COPILOT_OT_modifier_assistant(bpy.types.Operator):
     def _execute_shrinkwrap(self, selected, active) -> tuple[set, str]:
         """Execute Shrinkwrap workflow."""
         # Active object is source, other selected object is target
-        target = [obj for obj in selected if obj != active][0]
+        target = next(obj for obj in selected if obj is not active)
         return modifier_workflows.apply_shrinkwrap(active, target)
-
-
-# Registration
-def register():
-    """Register operator."""
-    bpy.utils.register_class(COPILOT_OT_modifier_assistant)
-
-
-def unregister():
-    """Unregister operator."""
-    bpy.utils.unregister_class(COPILOT_OT_modifier_assistant)
@@ -1,6 +1,46 @@
 import bpy
+from bpy.app.handlers import persistent
 from bpy.types import Panel
 
+from ..utils.validation import SUPPORTED_OBJECT_TYPES
+
+# Status key -> (label text, icon, active object attribute formatted into the text)
+_STATUS_LABELS = {
+    'NO_OBJECT': ("No object selected", 'INFO', None),
+    'WRONG_MODE': ("Must be in Object Mode", 'INFO', None),
+    'UNSUPPORTED': ("Object type '{}' not supported", 'INFO', 'type'),
+    'READY': ("Ready for: {}", 'CHECKMARK', 'name'),
+}
+
+# One-slot cache for the last draw check: [object pointer, mode, status key]
+_POLL_CACHE = [None, None, 'NO_OBJECT']
+
+
+def _get_status(active_obj, mode):
+    """Return the lighting operator's status key, reusing the last result.
+
+    Args:
+        active_obj: Active object or None
+        mode: Current context mode string
+
+    Returns:
+        A key of _STATUS_LABELS; 'READY' if the operator can run
+    """
+    obj_ptr = active_obj.as_pointer() if active_obj else None
+    if _POLL_CACHE[0] == obj_ptr and _POLL_CACHE[1] == mode:
+        return _POLL_CACHE[2]
+    
+    if active_obj is None:
+        status = 'NO_OBJECT'
+    elif mode != 'OBJECT':
+        status = 'WRONG_MODE'
+    elif active_obj.type not in SUPPORTED_OBJECT_TYPES:
+        status = 'UNSUPPORTED'
+    else:
+        status = 'READY'
+    _POLL_CACHE[:] = (obj_ptr, mode, status)
+    return status
+
 
 class COPILOT_PT_lighting_panel(Panel):
     """Panel for Copilot lighting tools in 3D Viewport"""
@@ -16,37 +56,26 @@ class COPILOT_PT_lighting_panel(Panel):
         """Draw the panel UI"""
         layout = self.layout
         
-        # Main operator button
-        col = layout.column(align=True)
-        col.scale_y = 1.5
-        
         # Check if we can execute the operator
         active_obj = context.active_object
-        can_execute = (active_obj is not None and 
-                      context.mode == 'OBJECT' and
-                      active_obj.type in {'MESH', 'CURVE', 'SURFACE', 'META', 'FONT'})
+        status = _get_status(active_obj, context.mode)
+        can_execute = status == 'READY'
         
-        if can_execute:
-            op = col.operator("copilot.create_three_point_lighting", 
-                            text="Create Three-Point Lighting", 
-                            icon='LIGHT')
-        else:
-            col.enabled = False
-            col.operator("copilot.create_three_point_lighting", 
-                        text="Create Three-Point Lighting", 
-                        icon='LIGHT')
+        # Main operator button
+        col = layout.column(align=True)
+        col.scale_y = 1.5
+        col.enabled = can_execute
+        col.operator("copilot.create_three_point_lighting", 
+                    text="Create Three-Point Lighting", 
+                    icon='LIGHT')
         
         # Status information
         layout.separator()
         
-        if not active_obj:
-            layout.label(text="No object selected", icon='INFO')
-        elif context.mode != 'OBJECT':
-            layout.label(text="Must be in Object Mode", icon='INFO')
-        elif active_obj.type not in {'MESH', 'CURVE', 'SURFACE', 'META', 'FONT'}:
-            layout.label(text=f"Object type '{active_obj.type}' not supported", icon='INFO')
-        else:
-            layout.label(text=f"Ready for: {active_obj.name}", icon='CHECKMARK')
+        text, icon, attr = _STATUS_LABELS[status]
+        if attr is not None:
+            text = text.format(getattr(active_obj, attr))
+        layout.label(text=text, icon=icon)
         
         # Advanced options (collapsible)
         if can_execute:
@@ -68,13 +97,29 @@ class COPILOT_PT_lighting_panel(Panel):
             col.label(text="Use F9 after operation to adjust", icon='INFO')
 
 
-def register():
-    bpy.utils.register_class(COPILOT_PT_lighting_panel)
+def _invalidate_poll_cache():
+    """Reset the one-slot draw check cache."""
+    _POLL_CACHE[:] = (None, None, 'NO_OBJECT')
 
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    """Invalidate the draw check cache when the scene changes."""
+    _invalidate_poll_cache()
 
-def unregister():
-    bpy.utils.unregister_class(COPILOT_PT_lighting_panel)
+@persistent
+def _on_load_post(*args):
+    """Invalidate the draw check cache when a new file is loaded."""
+    _invalidate_poll_cache()
 
+def register():
+    """Register draw check cache invalidation handlers."""
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    bpy.app.handlers.load_post.append(_on_load_post)
 
-if __name__ == "__main__":
-    register()
\ No newline at end of file
+def unregister():
+    """Unregister draw check cache invalidation handlers."""
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    _invalidate_poll_cache()
@@ -4,6 +4,34 @@ This panel provides the UI for the Intelligent Modifier Assistant feature.
 """
 
 import bpy
+from bpy.app.handlers import persistent
+
+from ..utils.context_validator import _count_object_types
+
+# Bound to copilot.preferences.get_preferences_snapshot on first use
+_get_prefs = None
+
+# Selection info rows cached between redraws; key is reset by depsgraph updates
+_SELECTION_CACHE = {"key": None, "lines": []}
+
+
+def _addon_preferences(context):
+    """Return the add-on preferences, importing the preferences module once.
+
+    Args:
+        context: Blender context
+
+    Returns:
+        Preferences snapshot, or None if the preferences module or the
+        add-on entry is unavailable
+    """
+    global _get_prefs
+    try:
+        if _get_prefs is None:
+            from copilot.preferences import get_preferences_snapshot as _get_prefs
+        return _get_prefs(context)
+    except (ImportError, KeyError):
+        return None
 
 
 class COPILOT_PT_modifier_assistant(bpy.types.Panel):
@@ -21,11 +49,8 @@ class COPILOT_PT_modifier_assistant(bpy.types.Panel):
         scene = context.scene
         
         # Get preferences for UI visibility options
-        try:
-            from copilot.preferences import get_addon_preferences
-            prefs = get_addon_preferences(context)
-        except (ImportError, KeyError):
-            prefs = None
+        prefs = _addon_preferences(context)
+        show_command_help = prefs is None or prefs.show_command_help
 
         # Command input section
         box = layout.box()
@@ -37,40 +62,8 @@ class COPILOT_PT_modifier_assistant(bpy.types.Panel):
         row.scale_y = 1.5
         row.operator("copilot.modifier_assistant", text="Execute", icon='PLAY')
 
-        # Selection info section (controlled by preferences)
-        if prefs is None or prefs.show_selection_info:
-            layout.separator()
-            info_box = layout.box()
-            info_box.label(text="Selection Info:", icon='INFO')
-
-            # Show current selection count and types
-            selected = context.selected_objects
-            active = context.active_object
-
-            if not selected:
-                info_box.label(text="No objects selected", icon='ERROR')
-            else:
-                info_box.label(text=f"Selected: {len(selected)} object(s)")
-
-                # Show object types
-                if len(selected) <= 3:
-                    for obj in selected:
-                        icon = 'MESH_DATA' if obj.type == 'MESH' else 'OUTLINER_OB_' + obj.type
-                        active_marker = " (active)" if obj == active else ""
-                        info_box.label(text=f"  • {obj.name} ({obj.type}){active_marker}")
-                else:
-                    # Count by type
-                    type_counts = {}
-                    for obj in selected:
-                        type_counts[obj.type] = type_counts.get(obj.type, 0) + 1
-                    for obj_type, count in type_counts.items():
-                        info_box.label(text=f"  • {obj_type}: {count}")
-
-                # Show current mode
-                info_box.label(text=f"Mode: {context.mode}")
-
         # Help section (controlled by preferences)
-        if prefs is None or prefs.show_command_help:
+        if show_command_help:
             layout.separator()
             help_box = layout.box()
             help_box.label(text="Recognized Commands:", icon='QUESTION')
@@ -85,16 +78,93 @@ class COPILOT_PT_modifier_assistant(bpy.types.Panel):
             col.label(text='• "shrinkwrap" / "wrap" → Shrinkwrap')
 
 
-# Registration
-def register():
-    """Register panel."""
-    bpy.utils.register_class(COPILOT_PT_modifier_assistant)
+class COPILOT_PT_modifier_selection_info(bpy.types.Panel):
+    """Selection info sub-panel, rebuilt only when the selection changes."""
 
+    bl_label = "Selection Info"
+    bl_idname = "COPILOT_PT_modifier_selection_info"
+    bl_parent_id = "COPILOT_PT_modifier_assistant"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'Copilot'
 
-def unregister():
-    """Unregister panel."""
-    bpy.utils.unregister_class(COPILOT_PT_modifier_assistant)
+    @classmethod
+    def poll(cls, context):
+        """Show only when enabled in preferences."""
+        prefs = _addon_preferences(context)
+        return prefs is None or prefs.show_selection_info
+
+    def draw(self, context):
+        """Draw cached selection rows, rebuilding them on selection change."""
+        selected = context.selected_objects
+        active = context.active_object
+        key = (
+            tuple(obj.as_pointer() for obj in selected),
+            context.mode,
+            active.as_pointer() if active else 0,
+        )
+        if key != _SELECTION_CACHE["key"]:
+            _SELECTION_CACHE["lines"] = _build_selection_lines(selected, active, context.mode)
+            _SELECTION_CACHE["key"] = key
+
+        layout = self.layout
+        for text, icon in _SELECTION_CACHE["lines"]:
+            layout.label(text=text, icon=icon)
+
+
+def _build_selection_lines(selected, active, mode) -> list[tuple[str, str]]:
+    """Build the (text, icon) rows shown in the selection info sub-panel.
+
+    Args:
+        selected: Selected objects
+        active: Active object or None
+        mode: Current context mode
+
+    Returns:
+        List of (text, icon) label rows
+    """
+    if not selected:
+        return [("No objects selected", 'ERROR')]
+
+    lines = [(f"Selected: {len(selected)} object(s)", 'NONE')]
 
+    # Show object types
+    if len(selected) <= 3:
+        # Pointer compare avoids RNA struct equality per object
+        active_ptr = active.as_pointer() if active else 0
+        for obj in selected:
+            active_marker = " (active)" if obj.as_pointer() == active_ptr else ""
+            lines.append((f"  • {obj.name} ({obj.type}){active_marker}", 'NONE'))
+    else:
+        # Count by type, the same way the workflow validators do
+        for obj_type, count in _count_object_types(selected).items():
+            lines.append((f"  • {obj_type}: {count}", 'NONE'))
 
-if __name__ == "__main__":
-    register()
+    # Show current mode
+    lines.append((f"Mode: {mode}", 'NONE'))
+    return lines
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    """Invalidate cached selection rows when the scene changes."""
+    _SELECTION_CACHE["key"] = None
+
+@persistent
+def _on_load_post(*args):
+    """Invalidate cached selection rows when a new file is loaded."""
+    _SELECTION_CACHE["key"] = None
+
+def register():
+    """Register selection info cache invalidation handlers."""
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    bpy.app.handlers.load_post.append(_on_load_post)
+
+def unregister():
+    """Unregister selection info cache invalidation handlers."""
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    _SELECTION_CACHE["key"] = None
+    _SELECTION_CACHE["lines"] = []
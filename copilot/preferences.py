@@ -5,11 +5,30 @@ This module defines the add-on preferences UI that appears in Blender's
 Edit > Preferences > Add-ons panel when the user expands the Blender Copilot add-on.
 """
 
+from types import SimpleNamespace
+
 import bpy
 from bpy.types import AddonPreferences
+from bpy.app.handlers import persistent
 from bpy.props import IntProperty, FloatProperty, BoolProperty
 
 
+def _invalidate_preference_caches():
+    """Drop values derived from the preferences so they are re-read."""
+    global _PREF_SNAPSHOT
+    _PREF_SNAPSHOT = None
+    
+    from .utils.context_validator import invalidate_performance_mode_cache
+    from .utils.performance import invalidate_performance_log_cache
+    invalidate_performance_mode_cache()
+    invalidate_performance_log_cache()
+
+
+def _on_preference_update(self, context):
+    """Property update callback: invalidate cached preference values."""
+    _invalidate_preference_caches()
+
+
 class CopilotAddonPreferences(AddonPreferences):
     """Preferences for Blender Copilot add-on."""
     
@@ -22,7 +41,8 @@ class CopilotAddonPreferences(AddonPreferences):
         description="Default number of copies for Smart Array workflow",
         default=5,
         min=1,
-        max=1000
+        max=1000,
+        update=_on_preference_update
     )
     
     default_array_offset_x: FloatProperty(
@@ -30,7 +50,8 @@ class CopilotAddonPreferences(AddonPreferences):
         description="Default X-axis offset for Smart Array workflow",
         default=1.0,
         min=-100.0,
-        max=100.0
+        max=100.0,
+        update=_on_preference_update
     )
     
     default_bevel_segments: IntProperty(
@@ -38,7 +59,8 @@ class CopilotAddonPreferences(AddonPreferences):
         description="Default number of segments for Hard Surface bevel modifier",
         default=3,
         min=1,
-        max=100
+        max=100,
+        update=_on_preference_update
     )
     
     default_subdivision_levels: IntProperty(
@@ -46,7 +68,8 @@ class CopilotAddonPreferences(AddonPreferences):
         description="Default viewport subdivision levels for Hard Surface workflow",
         default=2,
         min=0,
-        max=6
+        max=6,
+        update=_on_preference_update
     )
     
     default_solidify_thickness: FloatProperty(
@@ -55,33 +78,38 @@ class CopilotAddonPreferences(AddonPreferences):
         default=0.01,
         min=0.0001,
         max=10.0,
-        unit='LENGTH'
+        unit='LENGTH',
+        update=_on_preference_update
     )
     
     # UI Preferences
     show_command_help: BoolProperty(
         name="Show Command Help",
         description="Display recognized commands in the Modifier Assistant panel as help text",
-        default=True
+        default=True,
+        update=_on_preference_update
     )
     
     show_selection_info: BoolProperty(
         name="Show Selection Info",
         description="Display current selection count and types in Modifier Assistant panel",
-        default=True
+        default=True,
+        update=_on_preference_update
     )
     
     # Performance Preferences
     performance_mode: BoolProperty(
         name="Performance Mode",
         description="Skip some validation checks for faster execution (use with caution)",
-        default=False
+        default=False,
+        update=_on_preference_update
     )
     
     show_performance_metrics: BoolProperty(
         name="Show Performance Metrics",
         description="Log execution time metrics to console (for debugging)",
-        default=False
+        default=False,
+        update=_on_preference_update
     )
     
     def draw(self, context):
@@ -123,21 +151,66 @@ class CopilotAddonPreferences(AddonPreferences):
             col.label(text="Warning: Performance mode may skip important validations", icon='ERROR')
 
 
+# Cached preferences struct, resolved on first access and reset on unregister
+_CACHED_PREFS = None
+
+# Plain-Python copy of the preference values; reset by any preference update
+_PREF_SNAPSHOT = None
+
+
 def get_addon_preferences(context=None):
     """
     Convenience function to get add-on preferences.
     
+    The preferences struct is looked up once and reused, so callers in
+    draw() and other hot paths skip the add-on dictionary lookup.
+    
     Args:
         context: Blender context (optional, uses bpy.context if not provided)
     
     Returns:
         CopilotAddonPreferences: The add-on preferences instance
     """
-    if context is None:
-        context = bpy.context
+    global _CACHED_PREFS
     
-    preferences = context.preferences.addons[__package__].preferences
-    return preferences
+    if _CACHED_PREFS is None:
+        if context is None:
+            context = bpy.context
+        _CACHED_PREFS = context.preferences.addons[__package__].preferences
+    return _CACHED_PREFS
+
+
+def get_preferences_snapshot(context=None):
+    """
+    Get the preference values as a plain Python namespace.
+    
+    Attribute names match CopilotAddonPreferences, but reads are ordinary
+    Python attribute lookups instead of RNA accesses. The snapshot is
+    rebuilt after any preference is edited.
+    
+    Args:
+        context: Blender context (optional, uses bpy.context if not provided)
+    
+    Returns:
+        SimpleNamespace: Snapshot of the add-on preference values
+    """
+    global _PREF_SNAPSHOT
+    
+    if _PREF_SNAPSHOT is None:
+        prefs = get_addon_preferences(context)
+        _PREF_SNAPSHOT = SimpleNamespace(**{
+            name: getattr(prefs, name)
+            for name in CopilotAddonPreferences.__annotations__
+        })
+    return _PREF_SNAPSHOT
+
+
+@persistent
+def _on_load_factory_preferences(*args):
+    """Drop the cached preferences when factory settings replace them."""
+    global _CACHED_PREFS
+    _CACHED_PREFS = None
+    _invalidate_preference_caches()
 
 
 # Registration
@@ -150,10 +223,16 @@ def register():
     """Register preferences classes."""
     for cls in classes:
         bpy.utils.register_class(cls)
+    bpy.app.handlers.load_factory_preferences_post.append(_on_load_factory_preferences)
 
 
 def unregister():
     """Unregister preferences classes."""
+    global _CACHED_PREFS
+    _CACHED_PREFS = None
+    _invalidate_preference_caches()
+    if _on_load_factory_preferences in bpy.app.handlers.load_factory_preferences_post:
+        bpy.app.handlers.load_factory_preferences_post.remove(_on_load_factory_preferences)
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
@@ -105,12 +105,16 @@ def register():
 def unregister():
     """Unregister property groups."""
     # Remove command property from Scene
-    if hasattr(bpy.types.Scene, 'copilot_modifier_command'):
+    try:
         del bpy.types.Scene.copilot_modifier_command
+    except AttributeError:
+        pass
     
     # Remove from Scene
-    if hasattr(bpy.types.Scene, 'modifier_assistant'):
+    try:
         del bpy.types.Scene.modifier_assistant
+    except AttributeError:
+        pass
     
     # Unregister classes
     for cls in reversed(classes):
@@ -1,8 +1,11 @@
+from bisect import bisect_left
+
 import bpy
 import mathutils
 from .light_defaults import LIGHT_DEFAULTS, LIGHT_NAMES, TARGET_EMPTY_NAME, COLLECTION_NAME_PREFIX
 
-def create_area_light(name, location=(0, 0, 0), power=100, color_temp=5600, size=1.0):
+def create_area_light(name, location=(0, 0, 0), power=100, color_temp=5600, size=1.0,
+                      collection=None):
     """
     Create an area light with specified properties.
     
@@ -12,6 +15,8 @@ def create_area_light(name, location=(0, 0, 0), power=100, color_temp=5600, size
         power: Light power in watts
         color_temp: Color temperature in Kelvin
         size: Light size
+        collection: Optional collection to link the light into
+            (defaults to the active collection)
     
     Returns:
         bpy.types.Object: Created light object
@@ -26,18 +31,22 @@ def create_area_light(name, location=(0, 0, 0), power=100, color_temp=5600, size
     light_object = bpy.data.objects.new(name, light_data)
     light_object.location = location
     
-    # Link to scene
-    bpy.context.collection.objects.link(light_object)
+    # Link straight into the target collection to avoid a link/unlink roundtrip
+    if collection is None:
+        collection = bpy.context.collection
+    collection.objects.link(light_object)
     
     return light_object
 
-def create_target_empty(name, location=(0, 0, 0)):
+def create_target_empty(name, location=(0, 0, 0), collection=None):
     """
     Create an empty object to serve as track-to target.
     
     Args:
         name: Name for the empty object
         location: World location tuple (x, y, z)
+        collection: Optional collection to link the empty into
+            (defaults to the active collection)
     
     Returns:
         bpy.types.Object: Created empty object
@@ -47,8 +56,10 @@ def create_target_empty(name, location=(0, 0, 0)):
     empty.empty_display_type = 'SPHERE'
     empty.empty_display_size = 0.5
     
-    # Link to scene
-    bpy.context.collection.objects.link(empty)
+    # Link straight into the target collection to avoid a link/unlink roundtrip
+    if collection is None:
+        collection = bpy.context.collection
+    collection.objects.link(empty)
     
     return empty
 
@@ -65,8 +76,13 @@ def add_track_to_constraint(light_obj, target_obj):
     """
     constraint = light_obj.constraints.new(type='TRACK_TO')
     constraint.target = target_obj
-    constraint.track_axis = 'TRACK_NEGATIVE_Z'
-    constraint.up_axis = 'UP_Y'
+    
+    # Each constraint property write tags a depsgraph relations update, so
+    # skip writing the axes when a new Track To already has them (-Z / Y)
+    if constraint.track_axis != 'TRACK_NEGATIVE_Z':
+        constraint.track_axis = 'TRACK_NEGATIVE_Z'
+    if constraint.up_axis != 'UP_Y':
+        constraint.up_axis = 'UP_Y'
     
     return constraint
 
@@ -96,13 +112,30 @@ def move_object_to_collection(obj, collection):
         obj: Object to move
         collection: Target collection
     """
+    current = obj.users_collection
+    
+    # Already only in the target collection: nothing to relink
+    if len(current) == 1 and current[0] == collection:
+        return
+    
     # Remove from all current collections
-    for coll in obj.users_collection:
+    for coll in current:
         coll.objects.unlink(obj)
     
     # Add to target collection
     collection.objects.link(obj)
 
+# Color temperature bands: upper Kelvin bound (inclusive) of each band, and
+# the RGB for each band; temperatures above the last bound use the final entry
+_TEMP_THRESHOLDS = (3000, 4000, 5000, 6000)
+_TEMP_RGB = (
+    (1.0, 0.6, 0.3),   # Warm/tungsten
+    (1.0, 0.8, 0.6),   # Warm white
+    (1.0, 0.9, 0.8),   # Neutral
+    (1.0, 1.0, 0.95),  # Cool white
+    (0.8, 0.9, 1.0),   # Daylight/cool
+)
+
 def color_temperature_to_rgb(temp_k):
     """
     Convert color temperature in Kelvin to RGB values.
@@ -114,22 +147,29 @@ def color_temperature_to_rgb(temp_k):
     Returns:
         tuple: (r, g, b) values from 0.0 to 1.0
     """
-    # Simplified conversion for common lighting temperatures
-    if temp_k <= 3000:
-        return (1.0, 0.6, 0.3)  # Warm/tungsten
-    elif temp_k <= 4000:
-        return (1.0, 0.8, 0.6)  # Warm white
-    elif temp_k <= 5000:
-        return (1.0, 0.9, 0.8)  # Neutral
-    elif temp_k <= 6000:
-        return (1.0, 1.0, 0.95) # Cool white
-    else:
-        return (0.8, 0.9, 1.0)  # Daylight/cool
+    # bisect_left keeps each threshold inside its own (inclusive) band
+    return _TEMP_RGB[bisect_left(_TEMP_THRESHOLDS, temp_k)]
+
+def _name_in_use(name):
+    """
+    Check whether a name is taken by an existing object or collection.
+    
+    Args:
+        name: Name to check
+    
+    Returns:
+        bool: True if an object or collection already uses the name
+    """
+    return name in bpy.data.objects or name in bpy.data.collections
 
 def generate_unique_name(base_name, existing_names=None):
     """
     Generate a unique name by appending numbers if needed.
     
+    Without existing_names, names are checked directly against
+    bpy.data.objects and bpy.data.collections. The lowest free suffix is
+    used, so suffixes freed by deleted rigs are reused.
+    
     Args:
         base_name: Base name to start with
         existing_names: Optional set of existing names to avoid
@@ -137,14 +177,21 @@ def generate_unique_name(base_name, existing_names=None):
     Returns:
         str: Unique name
     """
-    if existing_names is None:
-        existing_names = {obj.name for obj in bpy.data.objects}
-    
-    if base_name not in existing_names:
+    if existing_names is not None:
+        if base_name not in existing_names:
+            return base_name
+        
+        counter = 1
+        while f"{base_name}.{counter:03d}" in existing_names:
+            counter += 1
+        
+        return f"{base_name}.{counter:03d}"
+    
+    if not _name_in_use(base_name):
         return base_name
     
     counter = 1
-    while f"{base_name}.{counter:03d}" in existing_names:
+    while _name_in_use(f"{base_name}.{counter:03d}"):
         counter += 1
     
     return f"{base_name}.{counter:03d}"
@@ -163,11 +210,7 @@ def cleanup_lighting_rig(collection_name):
     if not collection:
         return False
     
-    # Remove all objects in collection
-    for obj in collection.objects:
-        bpy.data.objects.remove(obj, do_unlink=True)
-    
-    # Remove collection
-    bpy.data.collections.remove(collection)
+    # Remove all objects in collection and the collection itself in one batch
+    bpy.data.batch_remove(ids=(*collection.objects, collection))
     
-    return True
\ No newline at end of file
+    return True
@@ -4,6 +4,8 @@ This module parses natural language commands and maps them to specific modifier
 Uses simple pattern matching for <10ms performance.
 """
 
+import functools
+import re
 from typing import Literal
 
 # Type alias for workflow identifiers
@@ -59,12 +61,44 @@ COMMAND_PATTERNS = {
     ],
 }
 
+# Patterns are matched against lowercased commands, so they must be lowercase
+assert all(
+    pattern == pattern.lower()
+    for patterns in COMMAND_PATTERNS.values()
+    for pattern in patterns
+), "COMMAND_PATTERNS entries must be lowercase"
 
+# Pattern -> workflow lookup and workflow -> priority (lower wins)
+_WORKFLOW_FOR_PATTERN = {
+    pattern: workflow_type
+    for workflow_type, patterns in COMMAND_PATTERNS.items()
+    for pattern in patterns
+}
+_WORKFLOW_PRIORITY = {
+    workflow_type: priority
+    for priority, workflow_type in enumerate(COMMAND_PATTERNS)
+}
+
+# All patterns compiled into one longest-first alternation at import time.
+# Wrapping it in a lookahead makes findall report every occurrence, even
+# overlapping ones, in a single scan; priority then picks the workflow.
+_COMMAND_REGEX = re.compile(
+    "(?=({}))".format(
+        "|".join(
+            re.escape(pattern)
+            for pattern in sorted(_WORKFLOW_FOR_PATTERN, key=len, reverse=True)
+        )
+    )
+)
+
+
+@functools.lru_cache(maxsize=1024)
 def parse_command(command_text: str) -> WorkflowType:
     """Parse natural language command to workflow type.
 
     Uses case-insensitive pattern matching against COMMAND_PATTERNS dictionary.
     Returns first matching workflow or 'UNKNOWN' if no patterns match.
+    Results are memoized, so re-running an identical command is a cache hit.
 
     Performance target: < 10ms
 
@@ -83,17 +117,18 @@ def parse_command(command_text: str) -> WorkflowType:
         >>> parse_command("xyz random text")
         'UNKNOWN'
     """
-    # Normalize command: lowercase and strip whitespace
-    normalized = command_text.lower().strip()
+    # Early return for empty/too short commands, before any allocation
+    if len(command_text) < 3:
+        return 'UNKNOWN'
+
+    # Normalize command: lowercase (skipped if already lowercase) and strip
+    if not command_text.islower():
+        command_text = command_text.lower()
+    normalized = command_text.strip()
 
-    # Early return for empty/too short commands
     if len(normalized) < 3:
         return 'UNKNOWN'
 
-    # Check each workflow pattern in priority order
-    for workflow_type, patterns in COMMAND_PATTERNS.items():
-        for pattern in patterns:
-            if pattern.lower() in normalized:
-                return workflow_type  # type: ignore
-
-    return 'UNKNOWN'
+    # Single regex scan finds every pattern; the highest-priority workflow wins
+    found = {_WORKFLOW_FOR_PATTERN[pattern] for pattern in _COMMAND_REGEX.findall(normalized)}
+    return min(found, key=_WORKFLOW_PRIORITY.__getitem__, default='UNKNOWN')  # type: ignore
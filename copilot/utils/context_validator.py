@@ -4,27 +4,47 @@ This module validates Blender selection context against workflow requirements.
 Provides specific error messages matching the operator contract.
 """
 
+from collections import Counter
 from typing import Optional
 import bpy  # noqa: F401
 
 
+# Cached performance_mode preference; None until first read
+_PERF_MODE_CACHE = [None]
+
+
 def _get_performance_mode() -> bool:
-    """Check if performance mode is enabled in preferences."""
+    """Check if performance mode is enabled in preferences (cached)."""
+    cached = _PERF_MODE_CACHE[0]
+    if cached is not None:
+        return cached
+
     try:
         from copilot.preferences import get_addon_preferences
         prefs = get_addon_preferences()
-        return prefs.performance_mode if prefs else False
     except (ImportError, KeyError):
+        # Preferences not available yet; don't cache the fallback
         return False
 
+    cached = _PERF_MODE_CACHE[0] = bool(prefs.performance_mode) if prefs else False
+    return cached
+
+
+def invalidate_performance_mode_cache():
+    """Forget the cached performance_mode preference."""
+    _PERF_MODE_CACHE[0] = None
 
-def validate_context(workflow_type: str) -> tuple[bool, str]:
+
+def validate_context(workflow_type: str, selected: Optional[list] = None,
+                     active=None) -> tuple[bool, str]:
     """Validate current Blender context against workflow requirements.
 
     Performance target: < 20ms
 
     Args:
         workflow_type: The workflow identifier (e.g., 'SMART_ARRAY')
+        selected: Snapshot of the selected objects; read from bpy.context if None
+        active: Active object; read from bpy.context if selected is None
 
     Returns:
         Tuple of (is_valid, error_message)
@@ -37,37 +57,35 @@ def validate_context(workflow_type: str) -> tuple[bool, str]:
         (False, "Please select an object first")
     
     Note:
-        If performance mode is enabled in preferences, some validations may be skipped.
+        If performance mode is enabled in preferences, mode and object type
+        checks are skipped; selection count checks still apply.
     """
-    # Validation routing by workflow type
-    validators = {
-        'SMART_ARRAY': _validate_smart_array,
-        'HARD_SURFACE': _validate_single_mesh,
-        'SYMMETRIZE': _validate_single_mesh,
-        'CURVE_DEFORM': _validate_mesh_and_curve,
-        'SOLIDIFY': _validate_single_mesh,
-        'SHRINKWRAP': _validate_two_meshes,
-    }
-
-    validator = validators.get(workflow_type)
+    validator = _VALIDATORS.get(workflow_type)
     if validator is None:
         return False, f"Unknown workflow type: {workflow_type}"
 
-    return validator()
+    if selected is None:
+        selected = bpy.context.selected_objects
+        active = bpy.context.active_object
+
+    return validator(selected, active)
 
 
-def _validate_smart_array() -> tuple[bool, str]:
+def _validate_smart_array(selected: list, active) -> tuple[bool, str]:
     """Validate for Smart Array workflow (1 mesh OR 1 mesh + 1 empty)."""
-    context = bpy.context
-    selected = context.selected_objects
+    mode = bpy.context.mode
 
     # Check for selection
     if not selected:
         return False, "Please select an object first"
 
+    # Performance mode: skip mode/type checks once the count is right
+    if len(selected) <= 2 and _get_performance_mode():
+        return True, ""
+
     # Check mode
-    if context.mode != 'OBJECT':
-        return False, f"This command must be run in Object Mode (currently in {context.mode})"
+    if mode != 'OBJECT':
+        return False, f"This command must be run in Object Mode (currently in {mode})"
 
     # Count object types
     type_counts = _count_object_types(selected)
@@ -90,18 +108,21 @@ def _validate_smart_array() -> tuple[bool, str]:
         return False, f"This command requires 1 or 2 selected object(s), but {num_objects} are selected"
 
 
-def _validate_single_mesh() -> tuple[bool, str]:
+def _validate_single_mesh(selected: list, active) -> tuple[bool, str]:
     """Validate for workflows requiring exactly 1 mesh object."""
-    context = bpy.context
-    selected = context.selected_objects
+    mode = bpy.context.mode
 
     # Check for selection
     if not selected:
         return False, "Please select an object first"
 
+    # Performance mode: skip mode/type checks once the count is right
+    if len(selected) == 1 and _get_performance_mode():
+        return True, ""
+
     # Check mode
-    if context.mode != 'OBJECT':
-        return False, f"This command must be run in Object Mode (currently in {context.mode})"
+    if mode != 'OBJECT':
+        return False, f"This command must be run in Object Mode (currently in {mode})"
 
     # Check count
     if len(selected) != 1:
@@ -114,18 +135,21 @@ def _validate_single_mesh() -> tuple[bool, str]:
     return True, ""
 
 
-def _validate_mesh_and_curve() -> tuple[bool, str]:
+def _validate_mesh_and_curve(selected: list, active) -> tuple[bool, str]:
     """Validate for Curve Deform workflow (1 mesh + 1 curve)."""
-    context = bpy.context
-    selected = context.selected_objects
+    mode = bpy.context.mode
 
     # Check for selection
     if not selected:
         return False, "Please select an object first"
 
+    # Performance mode: skip mode/type checks once the count is right
+    if len(selected) == 2 and _get_performance_mode():
+        return True, ""
+
     # Check mode
-    if context.mode != 'OBJECT':
-        return False, f"This command must be run in Object Mode (currently in {context.mode})"
+    if mode != 'OBJECT':
+        return False, f"This command must be run in Object Mode (currently in {mode})"
 
     # Check count
     if len(selected) != 2:
@@ -139,19 +163,21 @@ def _validate_mesh_and_curve() -> tuple[bool, str]:
     return False, "This command requires two selected objects: a mesh and a curve"
 
 
-def _validate_two_meshes() -> tuple[bool, str]:
+def _validate_two_meshes(selected: list, active) -> tuple[bool, str]:
     """Validate for Shrinkwrap workflow (2 meshes with active object)."""
-    context = bpy.context
-    selected = context.selected_objects
-    active = context.active_object
+    mode = bpy.context.mode
 
     # Check for selection
     if not selected:
         return False, "Please select an object first"
 
+    # Performance mode: skip mode/type checks once the count is right
+    if len(selected) == 2 and _active_in_selection(selected, active) and _get_performance_mode():
+        return True, ""
+
     # Check mode
-    if context.mode != 'OBJECT':
-        return False, f"This command must be run in Object Mode (currently in {context.mode})"
+    if mode != 'OBJECT':
+        return False, f"This command must be run in Object Mode (currently in {mode})"
 
     # Check count
     if len(selected) != 2:
@@ -163,12 +189,30 @@ def _validate_two_meshes() -> tuple[bool, str]:
         return False, "This command requires two mesh objects to be selected"
 
     # Check active object
-    if active is None or active not in selected:
+    if not _active_in_selection(selected, active):
         return False, "Please ensure one of the selected objects is active"
 
     return True, ""
 
 
+def _active_in_selection(selected: list, active) -> bool:
+    """Check the active object is selected, comparing pointers not RNA structs."""
+    if active is None:
+        return False
+    return active.as_pointer() in {obj.as_pointer() for obj in selected}
+
+
+# Validation routing by workflow type
+_VALIDATORS = {
+    'SMART_ARRAY': _validate_smart_array,
+    'HARD_SURFACE': _validate_single_mesh,
+    'SYMMETRIZE': _validate_single_mesh,
+    'CURVE_DEFORM': _validate_mesh_and_curve,
+    'SOLIDIFY': _validate_single_mesh,
+    'SHRINKWRAP': _validate_two_meshes,
+}
+
+
 def _count_object_types(objects: list) -> dict[str, int]:
     """Count objects by type.
 
@@ -179,8 +223,4 @@ def _count_object_types(objects: list) -> dict[str, int]:
         Dictionary mapping object types to counts
         Example: {'MESH': 2, 'EMPTY': 1}
     """
-    type_counts: dict[str, int] = {}
-    for obj in objects:
-        obj_type = obj.type
-        type_counts[obj_type] = type_counts.get(obj_type, 0) + 1
-    return type_counts
+    return Counter(obj.type for obj in objects)
@@ -1,5 +1,13 @@
 import math
+import bpy
 import mathutils
+from bpy.app.handlers import persistent
+
+# Cache of bounding box results keyed on object/data pointers and world matrix.
+# An object's entries are dropped when its geometry changes (depsgraph), and
+# all entries when a new file is loaded.
+_BBOX_CACHE: dict[tuple, dict] = {}
+_BBOX_CACHE_SIZE = 64
 
 def spherical_to_cartesian(radius, horizontal_angle_deg, vertical_angle_deg):
     """
@@ -24,10 +32,57 @@ def spherical_to_cartesian(radius, horizontal_angle_deg, vertical_angle_deg):
     
     return (x, y, z)
 
+def spherical_trig(horizontal_angle_deg, vertical_angle_deg):
+    """
+    Precompute the sines and cosines used by spherical_to_cartesian.
+    
+    Args:
+        horizontal_angle_deg: Horizontal angle in degrees (0 = +Y axis)
+        vertical_angle_deg: Vertical angle in degrees (0 = XY plane, 90 = +Z axis)
+    
+    Returns:
+        tuple: (sin_h, cos_h, sin_v, cos_v)
+    """
+    h_rad = math.radians(horizontal_angle_deg)
+    v_rad = math.radians(vertical_angle_deg)
+    return (math.sin(h_rad), math.cos(h_rad), math.sin(v_rad), math.cos(v_rad))
+
+def spherical_to_cartesian_precomputed(radius, trig):
+    """
+    Convert spherical coordinates to cartesian from precomputed trig values.
+    
+    Args:
+        radius: Distance from origin
+        trig: (sin_h, cos_h, sin_v, cos_v) as returned by spherical_trig
+    
+    Returns:
+        tuple: (x, y, z) cartesian coordinates
+    """
+    sin_h, cos_h, sin_v, cos_v = trig
+    horizontal_extent = radius * cos_v
+    return (horizontal_extent * sin_h, horizontal_extent * cos_h, radius * sin_v)
+
+def _bbox_cache_key(obj):
+    """
+    Build the cache key for an object's bounding box analysis.
+    
+    Args:
+        obj: Blender object
+    
+    Returns:
+        tuple: (object pointer, data pointer, flattened world matrix)
+    """
+    data_ptr = obj.data.as_pointer() if obj.data else 0
+    matrix_key = tuple(value for row in obj.matrix_world for value in row)
+    return (obj.as_pointer(), data_ptr, matrix_key)
+
 def analyze_bounding_box(obj):
     """
     Analyze object's bounding box and calculate useful properties.
     
+    Results are cached per object and world matrix so re-running the lighting
+    operator (e.g. F9 redo) on unchanged geometry skips the analysis.
+    
     Args:
         obj: Blender object
     
@@ -37,39 +92,82 @@ def analyze_bounding_box(obj):
     if not obj or not hasattr(obj, 'bound_box'):
         return None
     
-    # Get bounding box corners in local space
-    bbox_corners = [obj.matrix_world @ mathutils.Vector(corner) for corner in obj.bound_box]
-    
-    # Calculate center point
-    center = mathutils.Vector((0, 0, 0))
-    for corner in bbox_corners:
-        center += corner
-    center /= len(bbox_corners)
-    
-    # Calculate dimensions
-    min_coords = mathutils.Vector((
-        min(corner.x for corner in bbox_corners),
-        min(corner.y for corner in bbox_corners),
-        min(corner.z for corner in bbox_corners)
-    ))
-    max_coords = mathutils.Vector((
-        max(corner.x for corner in bbox_corners),
-        max(corner.y for corner in bbox_corners),
-        max(corner.z for corner in bbox_corners)
-    ))
-    
-    dimensions = max_coords - min_coords
+    key = _bbox_cache_key(obj)
+    cached = _BBOX_CACHE.get(key)
+    if cached is None:
+        cached = _compute_bounding_box(obj)
+        
+        # FIFO eviction keeps the cache bounded
+        if len(_BBOX_CACHE) >= _BBOX_CACHE_SIZE:
+            del _BBOX_CACHE[next(iter(_BBOX_CACHE))]
+        _BBOX_CACHE[key] = cached
+    
+    return dict(cached)
+
+def _read_bound_box(obj, np):
+    """
+    Read an object's 8 local bounding box corners into an (8, 3) array.
+    
+    Uses foreach_get to copy the flat 24-float RNA buffer in one call,
+    instead of iterating 8 per-corner array views.
+    
+    Args:
+        obj: Blender object
+        np: The numpy module (imported lazily by the caller)
+    
+    Returns:
+        numpy.ndarray: (8, 3) float64 array of local corners
+    """
+    bound_box = obj.bound_box
+    foreach_get = getattr(bound_box, 'foreach_get', None)
+    if foreach_get is None:
+        return np.array(bound_box, dtype=np.float64)
+    
+    # RNA float arrays are single precision; a matching buffer is copied directly
+    flat = np.empty(24, dtype=np.float32)
+    foreach_get(flat)
+    return flat.reshape(8, 3).astype(np.float64)
+
+def _compute_bounding_box(obj):
+    """
+    Compute bounding box properties for an object (uncached).
+    
+    The 8 bounding box corners are transformed to world space as a single
+    (8, 3) NumPy batch instead of one mathutils.Vector at a time.
+    
+    Args:
+        obj: Blender object
+    
+    Returns:
+        dict: Contains center, dimensions, radius, and corners
+    """
+    import numpy as np
+    
+    # Transform local bounding box corners to world space in one batch
+    matrix = np.array(obj.matrix_world, dtype=np.float64)
+    local_corners = _read_bound_box(obj, np)
+    world_corners = local_corners @ matrix[:3, :3].T + matrix[:3, 3]
+    
+    # Vectorized reductions over the corner array
+    min_arr = world_corners.min(axis=0)
+    max_arr = world_corners.max(axis=0)
+    center_arr = world_corners.mean(axis=0)
     
     # Calculate bounding sphere radius (maximum distance from center to any corner)
-    radius = max((corner - center).length for corner in bbox_corners)
+    radius = float(np.linalg.norm(world_corners - center_arr, axis=1).max())
+    
+    # Convert back to mathutils types only at the boundary
+    # Vectors are frozen because results are shared through the cache
+    min_coords = mathutils.Vector(min_arr).freeze()
+    max_coords = mathutils.Vector(max_arr).freeze()
     
     return {
-        'center': center,
-        'dimensions': dimensions,
+        'center': mathutils.Vector(center_arr).freeze(),
+        'dimensions': (max_coords - min_coords).freeze(),
         'radius': radius,
         'min_coords': min_coords,
         'max_coords': max_coords,
-        'corners': bbox_corners
+        'corners': tuple(mathutils.Vector(corner).freeze() for corner in world_corners)
     }
 
 def calculate_distance(point1, point2):
@@ -112,4 +210,41 @@ def calculate_light_position(target_center, horizontal_angle, vertical_angle, di
     # Add to target center to get world position
     world_pos = target_center + mathutils.Vector(rel_pos)
     
-    return world_pos
\ No newline at end of file
+    return world_pos
+
+def clear_bounding_box_cache():
+    """Drop all cached bounding box results."""
+    _BBOX_CACHE.clear()
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    """Drop cached bounding boxes of objects whose geometry changed."""
+    if not _BBOX_CACHE:
+        return
+    
+    # An update may name the object or its data; keys hold both pointers
+    pointers = {update.id.original.as_pointer()
+                for update in depsgraph.updates if update.is_updated_geometry}
+    if not pointers:
+        return
+    
+    for key in [key for key in _BBOX_CACHE if key[0] in pointers or key[1] in pointers]:
+        del _BBOX_CACHE[key]
+
+@persistent
+def _on_load_post(*args):
+    """Invalidate cached bounding boxes when a new file is loaded."""
+    _BBOX_CACHE.clear()
+
+def register():
+    """Register bounding box cache invalidation handlers."""
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    bpy.app.handlers.load_post.append(_on_load_post)
+
+def unregister():
+    """Unregister bounding box cache invalidation handlers."""
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    _BBOX_CACHE.clear()
@@ -1,34 +1,56 @@
 # Light Configuration Defaults
 # Based on data model specifications for three-point lighting setup
 
+import math
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, slots=True)
+class LightConfig:
+    """Immutable default settings for one light in the rig."""
+    power_watts: float
+    color_temperature: int
+    size: float
+    horizontal_angle: float
+    vertical_angle: float
+    distance_multiplier: float
+    light_type: str = 'AREA'
+    # (sin_h, cos_h, sin_v, cos_v) of the default angles, computed once
+    trig: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        h_rad = math.radians(self.horizontal_angle)
+        v_rad = math.radians(self.vertical_angle)
+        object.__setattr__(self, 'trig', (
+            math.sin(h_rad), math.cos(h_rad), math.sin(v_rad), math.cos(v_rad)
+        ))
+
+
 LIGHT_DEFAULTS = {
-    'KEY': {
-        'power_watts': 100,
-        'color_temperature': 5600,  # Daylight balanced
-        'size': 1.0,
-        'horizontal_angle': 45,     # 45 degrees from front
-        'vertical_angle': 30,       # 30 degrees elevation
-        'distance_multiplier': 3.0,
-        'light_type': 'AREA'
-    },
-    'FILL': {
-        'power_watts': 30,          # Softer than key
-        'color_temperature': 5600,
-        'size': 2.0,                # Larger for softer shadows
-        'horizontal_angle': -45,    # Opposite side from key
-        'vertical_angle': 15,       # Lower than key
-        'distance_multiplier': 3.5,
-        'light_type': 'AREA'
-    },
-    'RIM': {
-        'power_watts': 80,          # Strong for edge definition
-        'color_temperature': 6500,  # Slightly cooler
-        'size': 0.5,                # Smaller for sharper rim
-        'horizontal_angle': 135,    # Behind and to side
-        'vertical_angle': 45,       # Higher for rim effect
-        'distance_multiplier': 2.5,
-        'light_type': 'AREA'
-    }
+    'KEY': LightConfig(
+        power_watts=100,
+        color_temperature=5600,     # Daylight balanced
+        size=1.0,
+        horizontal_angle=45,        # 45 degrees from front
+        vertical_angle=30,          # 30 degrees elevation
+        distance_multiplier=3.0,
+    ),
+    'FILL': LightConfig(
+        power_watts=30,             # Softer than key
+        color_temperature=5600,
+        size=2.0,                   # Larger for softer shadows
+        horizontal_angle=-45,       # Opposite side from key
+        vertical_angle=15,          # Lower than key
+        distance_multiplier=3.5,
+    ),
+    'RIM': LightConfig(
+        power_watts=80,             # Strong for edge definition
+        color_temperature=6500,     # Slightly cooler
+        size=0.5,                   # Smaller for sharper rim
+        horizontal_angle=135,       # Behind and to side
+        vertical_angle=45,          # Higher for rim effect
+        distance_multiplier=2.5,
+    ),
 }
 
 # Collection naming convention
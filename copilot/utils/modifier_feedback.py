@@ -4,6 +4,8 @@ This module provides centralized error messages and feedback functions
 to ensure consistent user communication across the modifier assistant feature.
 """
 
+import functools
+
 # Error message constants matching operator contract specifications
 
 # Command recognition errors
@@ -54,6 +56,16 @@ SUCCESS_SOLIDIFY = "Solidify modifier added (thickness: 0.01m, even offset enabl
 SUCCESS_SHRINKWRAP = "Shrinkwrap modifier added (target: {target_name})"
 
 
+# Report level sets reused across calls, one per bpy.types.Operator.report type
+_REPORT_LEVELS = {
+    level: {level}
+    for level in (
+        'DEBUG', 'INFO', 'OPERATOR', 'PROPERTY', 'WARNING', 'ERROR',
+        'ERROR_INVALID_INPUT', 'ERROR_INVALID_CONTEXT', 'ERROR_OUT_OF_MEMORY',
+    )
+}
+
+
 def format_message(template: str, **kwargs) -> str:
     """Format a message template with provided values.
 
@@ -68,7 +80,17 @@ def format_message(template: str, **kwargs) -> str:
         >>> format_message(ERROR_WRONG_OBJECT_COUNT, expected=2, actual=1)
         'This command requires 2 selected object(s), but 1 are selected'
     """
-    return template.format(**kwargs)
+    try:
+        return _format_cached(template, tuple(sorted(kwargs.items())))
+    except TypeError:
+        # Unhashable value; format without caching
+        return template.format(**kwargs)
+
+
+@functools.lru_cache(maxsize=32)
+def _format_cached(template: str, items: tuple) -> str:
+    """Format a template from frozen (name, value) pairs, memoizing the result."""
+    return template.format(**dict(items))
 
 
 def report_to_user(operator, level: str, message: str):
@@ -86,4 +108,5 @@ def report_to_user(operator, level: str, message: str):
         >>> report_to_user(self, 'ERROR', ERROR_NO_SELECTION)
         >>> report_to_user(self, 'INFO', SUCCESS_ARRAY_SINGLE)
     """
-    operator.report({level}, message)
+    # Unlisted levels are passed through for Blender to validate, as before
+    operator.report(_REPORT_LEVELS.get(level) or {level}, message)
@@ -4,19 +4,105 @@ This module implements the six automated modifier workflows.
 Each workflow applies modifiers with optimized settings and handles prerequisites.
 """
 
-from typing import Optional
+from typing import NamedTuple, Optional
 import bpy  # noqa: F401
-import bmesh  # noqa: F401
 
+# bmesh and NumPy are only needed by apply_symmetrize and are imported there.
 
-def _get_preferences():
-    """Get add-on preferences with defaults fallback."""
+
+class WorkflowDefaults(NamedTuple):
+    """Workflow settings taken from add-on preferences."""
+    array_count: int = 5
+    array_offset_x: float = 1.0
+    bevel_segments: int = 3
+    subdivision_levels: int = 2
+    solidify_thickness: float = 0.01
+    array_msg: str = ""
+    solidify_msg: str = ""
+
+
+def _make_defaults(array_count: int, array_offset_x: float, bevel_segments: int,
+                   subdivision_levels: int, solidify_thickness: float) -> WorkflowDefaults:
+    """Build WorkflowDefaults with its success messages formatted once."""
+    return WorkflowDefaults(
+        array_count=array_count,
+        array_offset_x=array_offset_x,
+        bevel_segments=bevel_segments,
+        subdivision_levels=subdivision_levels,
+        solidify_thickness=solidify_thickness,
+        array_msg=f"Array modifier added with {array_count} copies on X-axis (offset {array_offset_x})",
+        solidify_msg=f"Solidify modifier added (thickness: {solidify_thickness:.4f}m, even offset enabled)",
+    )
+
+
+# Hardcoded defaults used when preferences are unavailable
+_FALLBACK_DEFAULTS = _make_defaults(*WorkflowDefaults()[:5])
+
+# Last (preferences snapshot, derived defaults); the snapshot object is
+# replaced whenever a preference changes, so identity marks staleness
+_DEFAULTS_CACHE = [None, _FALLBACK_DEFAULTS]
+
+# Bound to copilot.preferences.get_preferences_snapshot on first use
+_get_snapshot = None
+
+
+def _get_preferences() -> WorkflowDefaults:
+    """Get workflow defaults from add-on preferences with hardcoded fallback."""
+    global _get_snapshot
     try:
-        from copilot.preferences import get_addon_preferences
-        return get_addon_preferences()
+        if _get_snapshot is None:
+            from copilot.preferences import get_preferences_snapshot as _get_snapshot
+        snapshot = _get_snapshot()
     except (ImportError, KeyError):
-        # Fallback to None if preferences not available
-        return None
+        # Fallback to hardcoded defaults if preferences not available
+        return _FALLBACK_DEFAULTS
+
+    if snapshot is not _DEFAULTS_CACHE[0]:
+        _DEFAULTS_CACHE[:] = (snapshot, _make_defaults(
+            array_count=snapshot.default_array_count,
+            array_offset_x=snapshot.default_array_offset_x,
+            bevel_segments=snapshot.default_bevel_segments,
+            subdivision_levels=snapshot.default_subdivision_levels,
+            solidify_thickness=snapshot.default_solidify_thickness,
+        ))
+    return _DEFAULTS_CACHE[1]
+
+
+def _apply_scale(obj: 'bpy.types.Object') -> None:
+    """Bake an object's scale into its data, like Apply > Scale.
+
+    Plain single-user meshes are scaled directly through a foreach_get /
+    foreach_set NumPy pass, avoiding the operator round-trip. Anything the
+    operator treats specially (curves, shared data, shape keys, children,
+    negative or delta scale) falls back to bpy.ops.object.transform_apply.
+
+    Args:
+        obj: Object whose scale should be applied
+    """
+    scale = tuple(obj.scale)
+    if scale == (1.0, 1.0, 1.0):
+        return
+
+    data = obj.data
+    if (obj.type != 'MESH' or data.users > 1 or data.shape_keys is not None
+            or obj.children or min(scale) < 0.0
+            or tuple(obj.delta_scale) != (1.0, 1.0, 1.0)):
+        # Override rather than reassign the active object, so the view layer
+        # isn't tagged and only this object's scale is applied
+        with bpy.context.temp_override(active_object=obj, object=obj,
+                                       selected_editable_objects=[obj]):
+            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
+        return
+
+    import numpy as np
+
+    num_verts = len(data.vertices)
+    coords = np.empty(num_verts * 3, dtype=np.float32)
+    data.vertices.foreach_get("co", coords)
+    coords.reshape(num_verts, 3)[:] *= np.asarray(scale, dtype=np.float32)
+    data.vertices.foreach_set("co", coords)
+    data.update()
+    obj.scale = (1.0, 1.0, 1.0)
 
 
 def apply_smart_array_single(obj: 'bpy.types.Object') -> tuple[set, str]:
@@ -36,19 +122,22 @@ def apply_smart_array_single(obj: 'bpy.types.Object') -> tuple[set, str]:
     """
     try:
         # Get preferences or use hardcoded defaults
-        prefs = _get_preferences()
-        count = prefs.default_array_count if prefs else 5
-        offset_x = prefs.default_array_offset_x if prefs else 1.0
+        defaults = _get_preferences()
+        count = defaults.array_count
+        offset_x = defaults.array_offset_x
         
         # Add Array modifier
         modifier = obj.modifiers.new(name="Array", type='ARRAY')
 
-        # Configure for X-axis duplication
+        # Configure for X-axis duplication. Each RNA assignment is a
+        # string-keyed property lookup plus an update tag, and the Python API
+        # has no cheaper descriptor-based setter, so only write what differs
+        # from a fresh Array modifier (relative offset on, displace (1, 0, 0)).
         modifier.count = count
-        modifier.use_relative_offset = True
-        modifier.relative_offset_displace = (offset_x, 0.0, 0.0)
+        if offset_x != 1.0:
+            modifier.relative_offset_displace = (offset_x, 0.0, 0.0)
 
-        return {'FINISHED'}, f"Array modifier added with {count} copies on X-axis (offset {offset_x})"
+        return {'FINISHED'}, defaults.array_msg
 
     except Exception as e:
         return {'CANCELLED'}, f"Failed to add Array modifier: {str(e)}"
@@ -103,10 +192,19 @@ def apply_hard_surface_setup(obj: 'bpy.types.Object') -> tuple[set, str]:
     """
     try:
         # Get preferences or use hardcoded defaults
-        prefs = _get_preferences()
-        bevel_segments = prefs.default_bevel_segments if prefs else 3
-        subsurf_levels = prefs.default_subdivision_levels if prefs else 2
+        defaults = _get_preferences()
+        bevel_segments = defaults.bevel_segments
+        subsurf_levels = defaults.subdivision_levels
         
+        # Set smooth shading first, so the mesh data is final before the
+        # modifier stack is built on top of it. Faces are smooth unless
+        # flagged in the "sharp_face" attribute, so dropping the attribute
+        # smooths every face in one call (removal tags the mesh for update)
+        mesh = obj.data
+        sharp_face = mesh.attributes.get("sharp_face")
+        if sharp_face is not None:
+            mesh.attributes.remove(sharp_face)
+
         # Add Bevel modifier first
         bevel = obj.modifiers.new(name="Bevel", type='BEVEL')
         bevel.limit_method = 'ANGLE'
@@ -116,12 +214,6 @@ def apply_hard_surface_setup(obj: 'bpy.types.Object') -> tuple[set, str]:
         subsurf = obj.modifiers.new(name="Subdivision", type='SUBSURF')
         subsurf.levels = subsurf_levels
 
-        # Set smooth shading
-        # Need to use mesh data for shading (deprecated ops method)
-        mesh = obj.data
-        for poly in mesh.polygons:
-            poly.use_smooth = True
-
         return {'FINISHED'}, "Hard-surface setup applied (Bevel + Subdivision + Smooth)"
 
     except Exception as e:
@@ -133,8 +225,8 @@ def apply_symmetrize(obj: 'bpy.types.Object') -> tuple[set, str]:
 
     Multi-step workflow:
     1. Apply scale transformation
-    2. Add Mirror modifier on X-axis
-    3. Delete vertices on positive X side
+    2. Delete vertices on positive X side
+    3. Add Mirror modifier on X-axis
 
     Args:
         obj: Target mesh object
@@ -144,62 +236,56 @@ def apply_symmetrize(obj: 'bpy.types.Object') -> tuple[set, str]:
 
     Performance target: < 200ms
     """
+    import bmesh
+    import numpy as np
+
     try:
         # Step 1: Apply scale
-        # Store current mode to restore later
-        original_mode = bpy.context.mode
-
-        # Ensure we're in object mode
+        # Ensure the target is active and we're in object mode
         if bpy.context.active_object != obj:
             bpy.context.view_layer.objects.active = obj
 
-        if original_mode != 'OBJECT':
+        if bpy.context.mode != 'OBJECT':
             bpy.ops.object.mode_set(mode='OBJECT')
 
         # Apply scale transformation
-        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
+        _apply_scale(obj)
 
-        # Step 2: Add Mirror modifier
+        # Step 2: Delete positive X vertices
+        # Find them with one vectorized pass over the coordinates
+        # (scale is applied, so mesh data is final)
+        mesh = obj.data
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", coords)
+        delete_indices = np.flatnonzero(coords[0::3] > 0.0).tolist()
+
+        if delete_indices:
+            # Edit the mesh data through a standalone bmesh in Object Mode;
+            # bmesh indices match mesh.vertices after from_mesh
+            bm = bmesh.new()
+            try:
+                bm.from_mesh(mesh)
+                bm.verts.ensure_lookup_table()
+                bm_verts = bm.verts
+                verts_to_delete = [bm_verts[i] for i in delete_indices]
+
+                # Delete in one operation (selection state is not used)
+                bmesh.ops.delete(bm, geom=verts_to_delete, context='VERTS')
+                bm.to_mesh(mesh)
+            finally:
+                bm.free()
+            mesh.update()
+
+        # Step 3: Add Mirror modifier last, so it is only ever evaluated
+        # against the cleaned half
         mirror = obj.modifiers.new(name="Mirror", type='MIRROR')
         mirror.use_axis = (True, False, False)  # X-axis
         mirror.use_bisect_axis = (True, False, False)
         mirror.use_clip = True
 
-        # Step 3: Delete positive X vertices
-        # Enter Edit Mode
-        bpy.ops.object.mode_set(mode='EDIT')
-
-        # Use bmesh for vertex operations
-        mesh = obj.data
-        bm = bmesh.from_edit_mesh(mesh)
-
-        # Deselect all
-        for vert in bm.verts:
-            vert.select = False
-
-        # Select vertices where x > 0
-        verts_to_delete = [v for v in bm.verts if v.co.x > 0.0]
-        for vert in verts_to_delete:
-            vert.select = True
-
-        # Delete selected vertices
-        bmesh.ops.delete(bm, geom=verts_to_delete, context='VERTS')
-
-        # Update mesh
-        bmesh.update_edit_mesh(mesh)
-
-        # Return to Object Mode
-        bpy.ops.object.mode_set(mode='OBJECT')
-
         return {'FINISHED'}, "Symmetrize applied on X-axis (scale applied, positive X deleted)"
 
     except Exception as e:
-        # Ensure we return to object mode on error
-        try:
-            if bpy.context.mode != 'OBJECT':
-                bpy.ops.object.mode_set(mode='OBJECT')
-        except:  # noqa: E722
-            pass
         return {'CANCELLED'}, f"Failed to apply symmetrize: {str(e)}"
 
 
@@ -224,28 +310,19 @@ def apply_curve_deform(
     Performance target: < 150ms
     """
     try:
-        # Store original active object
-        original_active = bpy.context.active_object
-
         # Step 1: Apply scale to mesh
-        bpy.context.view_layer.objects.active = mesh_obj
-        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
+        _apply_scale(mesh_obj)
 
         # Step 2: Apply scale to curve
-        bpy.context.view_layer.objects.active = curve_obj
-        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
+        _apply_scale(curve_obj)
 
         # Step 3: Align mesh origin to curve origin
         mesh_obj.location = curve_obj.location.copy()
 
         # Step 4: Add Curve modifier to mesh
-        bpy.context.view_layer.objects.active = mesh_obj
         modifier = mesh_obj.modifiers.new(name="Curve", type='CURVE')
         modifier.object = curve_obj
 
-        # Restore original active object
-        bpy.context.view_layer.objects.active = original_active
-
         return {'FINISHED'}, "Curve deform applied (scales applied, origins aligned)"
 
     except Exception as e:
@@ -267,15 +344,15 @@ def apply_solidify(obj: 'bpy.types.Object') -> tuple[set, str]:
     """
     try:
         # Get preferences or use hardcoded defaults
-        prefs = _get_preferences()
-        thickness = prefs.default_solidify_thickness if prefs else 0.01
+        defaults = _get_preferences()
+        thickness = defaults.solidify_thickness
         
         # Add Solidify modifier
         modifier = obj.modifiers.new(name="Solidify", type='SOLIDIFY')
         modifier.thickness = thickness
         modifier.use_even_offset = True
 
-        return {'FINISHED'}, f"Solidify modifier added (thickness: {thickness:.4f}m, even offset enabled)"
+        return {'FINISHED'}, defaults.solidify_msg
 
     except Exception as e:
         return {'CANCELLED'}, f"Failed to add Solidify modifier: {str(e)}"
@@ -310,6 +387,11 @@ def apply_shrinkwrap(
         return {'CANCELLED'}, f"Failed to add Shrinkwrap modifier: {str(e)}"
 
 
+# (type1, type2) -> whether the pair must be swapped to put the mesh first
+_MESH_EMPTY_SWAP = {('MESH', 'EMPTY'): False, ('EMPTY', 'MESH'): True}
+_MESH_CURVE_SWAP = {('MESH', 'CURVE'): False, ('CURVE', 'MESH'): True}
+
+
 def identify_mesh_and_empty(
     obj1: 'bpy.types.Object',
     obj2: 'bpy.types.Object'
@@ -323,12 +405,10 @@ def identify_mesh_and_empty(
     Returns:
         Tuple of (mesh_obj, empty_obj) or (None, None) if types don't match
     """
-    if obj1.type == 'MESH' and obj2.type == 'EMPTY':
-        return obj1, obj2
-    elif obj1.type == 'EMPTY' and obj2.type == 'MESH':
-        return obj2, obj1
-    else:
+    swap = _MESH_EMPTY_SWAP.get((obj1.type, obj2.type))
+    if swap is None:
         return None, None
+    return (obj2, obj1) if swap else (obj1, obj2)
 
 
 def identify_mesh_and_curve(
@@ -344,9 +424,7 @@ def identify_mesh_and_curve(
     Returns:
         Tuple of (mesh_obj, curve_obj) or (None, None) if types don't match
     """
-    if obj1.type == 'MESH' and obj2.type == 'CURVE':
-        return obj1, obj2
-    elif obj1.type == 'CURVE' and obj2.type == 'MESH':
-        return obj2, obj1
-    else:
+    swap = _MESH_CURVE_SWAP.get((obj1.type, obj2.type))
+    if swap is None:
         return None, None
+    return (obj2, obj1) if swap else (obj1, obj2)
@@ -7,21 +7,115 @@ Includes utilities from the lighting feature for compatibility.
 """
 
 import time
+import math
+import logging
 import functools
+from array import array
+from collections import Counter, deque
 from typing import Callable, Any
-import bpy  # noqa: F401
-import mathutils  # noqa: F401
+import bpy
+
+
+# Timing records are buffered in memory rather than printed, so a console
+# write never lands inside (or between) the intervals being measured
+_log = logging.getLogger("copilot.perf")
+_log.propagate = False
+_log.setLevel(logging.INFO)
+
+_PERF_BUFFER = deque(maxlen=1000)
+_PERF_HANDLER_NAME = "copilot.perf.buffer"
+
+
+class _PerfBufferHandler(logging.Handler):
+    """Append performance log records to _PERF_BUFFER until dumped."""
+
+    def emit(self, record):
+        _PERF_BUFFER.append(record)
+
+
+# Replace the handler left behind by a previous load of this module
+for _handler in list(_log.handlers):
+    if _handler.get_name() == _PERF_HANDLER_NAME:
+        _log.removeHandler(_handler)
+_handler = _PerfBufferHandler()
+_handler.set_name(_PERF_HANDLER_NAME)
+_log.addHandler(_handler)
+del _handler
+
+
+# Cached show_performance_metrics preference; None until first read
+_PERF_LOG_CACHE = [None]
 
 
 def _should_log_performance() -> bool:
-    """Check if performance metrics logging is enabled in preferences."""
+    """Check if performance metrics logging is enabled in preferences (cached)."""
+    cached = _PERF_LOG_CACHE[0]
+    if cached is not None:
+        return cached
+
     try:
         from copilot.preferences import get_addon_preferences
         prefs = get_addon_preferences()
-        return prefs.show_performance_metrics if prefs else False
-    except (ImportError, KeyError, AttributeError):
+    except (ImportError, KeyError):
+        # Preferences not available yet; don't cache the fallback
         return False
 
+    cached = _PERF_LOG_CACHE[0] = bool(getattr(prefs, 'show_performance_metrics', False))
+    return cached
+
+
+def invalidate_performance_log_cache():
+    """Forget the cached show_performance_metrics preference."""
+    _PERF_LOG_CACHE[0] = None
+
+
+def _record_timing(op_name: str, duration_ms: float, target_ms: float = None):
+    """Buffer one timing sample, at WARNING level if it exceeded its target."""
+    extra = {'op_name': op_name, 'duration_ms': duration_ms, 'target_ms': target_ms}
+    if target_ms is None:
+        _log.info("%s: %.2fms", op_name, duration_ms, extra=extra)
+    elif duration_ms > target_ms:
+        _log.warning("%s: %.2fms (exceeded target %sms)",
+                     op_name, duration_ms, target_ms, extra=extra)
+    else:
+        _log.info("%s: %.2fms (target %sms)", op_name, duration_ms, target_ms, extra=extra)
+
+
+def dump_perf_log(clear: bool = True) -> list[str]:
+    """Print buffered timings aggregated per operation.
+
+    Each operation gets one line such as
+    ``apply_solidify: n=1234 mean=2.10ms p99=5.30ms``, with an
+    ``exceeded=<count>`` suffix when any sample missed its target.
+
+    Args:
+        clear: Empty the buffer after dumping
+
+    Returns:
+        The printed summary lines
+    """
+    samples = {}
+    exceeded = Counter()
+    for record in _PERF_BUFFER:
+        samples.setdefault(record.op_name, []).append(record.duration_ms)
+        if record.levelno >= logging.WARNING:
+            exceeded[record.op_name] += 1
+
+    lines = []
+    for op_name, durations in samples.items():
+        durations.sort()
+        n = len(durations)
+        p99 = durations[max(0, math.ceil(n * 0.99) - 1)]
+        line = f"{op_name}: n={n} mean={sum(durations) / n:.2f}ms p99={p99:.2f}ms"
+        if exceeded[op_name]:
+            line += f" exceeded={exceeded[op_name]}"
+        print(line)
+        lines.append(line)
+
+    if clear:
+        _PERF_BUFFER.clear()
+    return lines
+
 
 def performance_monitor(target_ms: float = None, operation_name: str = None):
     """Decorator for monitoring function execution time.
@@ -36,8 +130,9 @@ def performance_monitor(target_ms: float = None, operation_name: str = None):
             # ... implementation
             pass
     
-    If show_performance_metrics is enabled in preferences, logs timing info.
-    If target_ms is provided and exceeded, logs a warning.
+    If show_performance_metrics is enabled in preferences, buffers timing info
+    for dump_perf_log(). If target_ms is provided and exceeded, the sample is
+    logged as a warning.
     """
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
@@ -50,24 +145,14 @@ def performance_monitor(target_ms: float = None, operation_name: str = None):
                 return func(*args, **kwargs)
             
             # Performance logging enabled - measure execution time
-            start_time = time.perf_counter()
+            start_ns = time.perf_counter_ns()
             result = func(*args, **kwargs)
-            end_time = time.perf_counter()
-            
-            # Calculate duration in milliseconds
-            duration_ms = (end_time - start_time) * 1000.0
+            end_ns = time.perf_counter_ns()
             
-            # Get operation name
-            op_name = operation_name or func.__name__
+            # Integer nanoseconds, converted to milliseconds once
+            duration_ms = (end_ns - start_ns) / 1_000_000
             
-            # Log timing information
-            if target_ms is not None:
-                if duration_ms > target_ms:
-                    print(f"⚠️  {op_name}: {duration_ms:.2f}ms (exceeded target {target_ms}ms)")
-                else:
-                    print(f"✓ {op_name}: {duration_ms:.2f}ms (target {target_ms}ms)")
-            else:
-                print(f"⏱️  {op_name}: {duration_ms:.2f}ms")
+            _record_timing(operation_name or func.__name__, duration_ms, target_ms)
             
             return result
         
@@ -96,37 +181,29 @@ class PerformanceTimer:
         """
         self.operation_name = operation_name
         self.target_ms = target_ms
-        self.start_time = None
-        self.end_time = None
+        self._start_ns = None
+        self._end_ns = None
         self.duration_ms = None
     
     def __enter__(self):
         """Start timing."""
-        self.start_time = time.perf_counter()
+        self._start_ns = time.perf_counter_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Stop timing and log results if enabled."""
-        self.end_time = time.perf_counter()
-        self.duration_ms = (self.end_time - self.start_time) * 1000.0
+        self._end_ns = time.perf_counter_ns()
+        self.duration_ms = (self._end_ns - self._start_ns) / 1_000_000
         
         # Only log if performance metrics are enabled
         if _should_log_performance():
-            if self.target_ms is not None:
-                if self.duration_ms > self.target_ms:
-                    print(f"⚠️  {self.operation_name}: {self.duration_ms:.2f}ms "
-                          f"(exceeded target {self.target_ms}ms)")
-                else:
-                    print(f"✓ {self.operation_name}: {self.duration_ms:.2f}ms "
-                          f"(target {self.target_ms}ms)")
-            else:
-                print(f"⏱️  {self.operation_name}: {self.duration_ms:.2f}ms")
+            _record_timing(self.operation_name, self.duration_ms, self.target_ms)
 
 
 def profile_operator_execution(execute_func: Callable) -> Callable:
     """Decorator for profiling operator execute() method with detailed breakdown.
     
-    Measures parsing, validation, and workflow execution separately, plus total time.
+    Records total execute() time against the 350ms contract target.
     Only logs when show_performance_metrics is enabled in preferences.
     
     Usage:
@@ -143,25 +220,14 @@ def profile_operator_execution(execute_func: Callable) -> Callable:
             return execute_func(self, context)
         
         # Performance logging enabled - measure total execution
-        print("\n" + "="*60)
-        print("PERFORMANCE PROFILE: Modifier Assistant Operator")
-        print("="*60)
-        
-        start_time = time.perf_counter()
+        start_ns = time.perf_counter_ns()
         result = execute_func(self, context)
-        end_time = time.perf_counter()
+        end_ns = time.perf_counter_ns()
         
-        total_duration_ms = (end_time - start_time) * 1000.0
+        total_duration_ms = (end_ns - start_ns) / 1_000_000
         
         # Log total with contract target
-        print("-"*60)
-        if total_duration_ms > 350.0:
-            print(f"⚠️  TOTAL EXECUTION: {total_duration_ms:.2f}ms "
-                  f"(exceeded target 350ms)")
-        else:
-            print(f"✓ TOTAL EXECUTION: {total_duration_ms:.2f}ms "
-                  f"(target 350ms)")
-        print("="*60 + "\n")
+        _record_timing("Modifier Assistant Operator", total_duration_ms, 350.0)
         
         return result
     
@@ -173,92 +239,122 @@ def profile_operator_execution(execute_func: Callable) -> Callable:
 # ============================================================================
 
 def optimize_bounding_box_calculation(obj):
-    """Optimized bounding box calculation for better performance (lighting feature)."""
-    if not obj or not hasattr(obj, 'bound_box'):
+    """Optimized bounding box calculation for better performance (lighting feature).
+
+    Reads from geometry.analyze_bounding_box, so both share one cache and its
+    invalidation. The radius here is half the largest dimension rather than
+    the bounding sphere radius.
+    """
+    from .geometry import analyze_bounding_box
+
+    bbox = analyze_bounding_box(obj)
+    if bbox is None:
         return None
     
-    matrix = obj.matrix_world
-    local_corners = obj.bound_box
-    world_corners = [matrix @ mathutils.Vector(corner) for corner in local_corners]
-    
-    xs = [corner.x for corner in world_corners]
-    ys = [corner.y for corner in world_corners]
-    zs = [corner.z for corner in world_corners]
-    
-    min_coords = mathutils.Vector((min(xs), min(ys), min(zs)))
-    max_coords = mathutils.Vector((max(xs), max(ys), max(zs)))
-    center = (min_coords + max_coords) * 0.5
-    dimensions = max_coords - min_coords
-    radius = max(dimensions) * 0.5
-    
+    dimensions = bbox['dimensions']
     return {
-        'center': center,
+        'center': bbox['center'],
         'dimensions': dimensions,
-        'radius': radius,
-        'min_coords': min_coords,
-        'max_coords': max_coords
+        'radius': max(dimensions) * 0.5,
+        'min_coords': bbox['min_coords'],
+        'max_coords': bbox['max_coords']
     }
 
 
+# (qualified name, duration ns) samples from measure_execution_time
+_TIMINGS = deque(maxlen=4096)
+
+
 def measure_execution_time(func):
-    """Decorator to measure execution time (lighting feature compatibility)."""
+    """Decorator to measure execution time (lighting feature compatibility).
+
+    Samples go to a ring buffer drained by flush_timings(); only calls over
+    one second are printed immediately.
+    """
+    name = func.__qualname__
+    perf_counter_ns = time.perf_counter_ns
+    
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_ns = perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
+        elapsed_ns = perf_counter_ns() - start_ns
         
-        execution_time = end_time - start_time
-        print(f"{func.__name__} executed in {execution_time:.4f} seconds")
-        
-        if execution_time > 1.0:
-            print(f"WARNING: {func.__name__} exceeded 1 second execution time")
+        _TIMINGS.append((name, elapsed_ns))
+        if elapsed_ns > 1_000_000_000:
+            print(f"WARNING: {name} exceeded 1 second execution time "
+                  f"({elapsed_ns / 1_000_000_000:.4f} seconds)")
         
         return result
     
     return wrapper
 
 
+def flush_timings() -> list[tuple[str, int]]:
+    """Print and drain samples recorded by measure_execution_time.
+
+    Returns:
+        The drained (qualified name, duration ns) samples, oldest first
+    """
+    samples = list(_TIMINGS)
+    _TIMINGS.clear()
+    for name, elapsed_ns in samples:
+        print(f"{name} executed in {elapsed_ns / 1_000_000_000:.4f} seconds")
+    return samples
+
+
 class PerformanceMonitor:
-    """Monitor performance metrics during operations (lighting feature compatibility)."""
+    """Monitor performance metrics during operations (lighting feature compatibility).
+
+    Checkpoints are stored as parallel arrays: names in a list and elapsed
+    nanoseconds in a contiguous array('q'), with no per-checkpoint tuple.
+    """
     
     def __init__(self):
-        self.start_time = None
-        self.checkpoints = []
+        self._start_ns = None
+        self._names = []
+        self._elapsed_ns = array('q')
+    
+    @property
+    def checkpoints(self):
+        """(name, elapsed seconds) pairs, built on demand."""
+        return [(name, elapsed_ns / 1_000_000_000)
+                for name, elapsed_ns in zip(self._names, self._elapsed_ns)]
     
     def start(self):
         """Start performance monitoring."""
-        self.start_time = time.time()
-        self.checkpoints = []
+        self._start_ns = time.perf_counter_ns()
+        self._names = []
+        self._elapsed_ns = array('q')
     
     def checkpoint(self, name):
-        """Add a performance checkpoint."""
-        if self.start_time is None:
+        """Add a performance checkpoint (elapsed time since start)."""
+        if self._start_ns is None:
             return
         
-        current_time = time.time()
-        elapsed = current_time - self.start_time
-        self.checkpoints.append((name, elapsed))
+        self._names.append(name)
+        self._elapsed_ns.append(time.perf_counter_ns() - self._start_ns)
     
     def report(self):
         """Report performance metrics."""
-        if not self.checkpoints:
+        if not self._names:
             return
         
-        print("Performance Report:")
-        for name, elapsed in self.checkpoints:
-            print(f"  {name}: {elapsed:.4f}s")
+        lines = ["Performance Report:"]
+        lines.extend(f"  {name}: {elapsed_ns / 1_000_000_000:.4f}s"
+                     for name, elapsed_ns in zip(self._names, self._elapsed_ns))
         
-        total_time = self.checkpoints[-1][1]
+        total_time = self._elapsed_ns[-1] / 1_000_000_000
         if total_time > 1.0:
-            print(f"WARNING: Total execution time {total_time:.4f}s exceeds target")
+            lines.append(f"WARNING: Total execution time {total_time:.4f}s exceeds target")
+        print("\n".join(lines))
     
     def meets_performance_target(self, target_seconds=1.0):
         """Check if performance meets target."""
-        if not self.checkpoints:
+        if not self._names:
             return True
         
-        total_time = self.checkpoints[-1][1]
-        return total_time <= target_seconds
+        return self._elapsed_ns[-1] <= target_seconds * 1_000_000_000
 
 
 # Registration (no classes to register)
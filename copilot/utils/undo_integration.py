@@ -21,6 +21,25 @@ def validate_undo_state():
     # Check if undo is available
     return bpy.ops.ed.undo.poll()
 
+def _same_names(id_collection, names):
+    """
+    Check whether an ID collection holds exactly the given names.
+    
+    Compares counts first, then the name lists (Blender keeps ID lists
+    sorted by name), and only hashes into sets if the order differs.
+    
+    Args:
+        id_collection: bpy.data collection such as bpy.data.objects
+        names: List of names captured earlier with keys()
+    
+    Returns:
+        bool: True if the names match
+    """
+    if len(id_collection) != len(names):
+        return False
+    current = id_collection.keys()
+    return current == names or set(current) == set(names)
+
 def test_undo_redo_cycle(context):
     """
     Test that undo/redo works correctly for lighting operations.
@@ -33,8 +52,8 @@ def test_undo_redo_cycle(context):
     """
     try:
         # Store initial state
-        initial_objects = set(bpy.data.objects.keys())
-        initial_collections = set(bpy.data.collections.keys())
+        initial_objects = bpy.data.objects.keys()
+        initial_collections = bpy.data.collections.keys()
         
         # Check if undo is available before operation
         if not validate_undo_state():
@@ -48,23 +67,16 @@ def test_undo_redo_cycle(context):
             bpy.ops.ed.undo()
             
             # Check that objects were removed
-            after_undo_objects = set(bpy.data.objects.keys())
-            after_undo_collections = set(bpy.data.collections.keys())
-            
-            if after_undo_objects != initial_objects:
+            if not _same_names(bpy.data.objects, initial_objects):
                 return False, "Undo did not properly remove created objects"
             
-            if after_undo_collections != initial_collections:
+            if not _same_names(bpy.data.collections, initial_collections):
                 return False, "Undo did not properly remove created collections"
         
         # Perform redo
         if bpy.ops.ed.redo.poll():
             bpy.ops.ed.redo()
             
-            # Check that objects were recreated
-            after_redo_objects = set(bpy.data.objects.keys())
-            after_redo_collections = set(bpy.data.collections.keys())
-            
             # Objects and collections should be restored
             # (exact check would depend on operation results)
         
@@ -79,20 +91,17 @@ def cleanup_orphaned_data():
     This is a utility function for maintaining scene cleanliness.
     """
     try:
-        # Remove orphaned meshes
-        for mesh in bpy.data.meshes:
-            if mesh.users == 0:
-                bpy.data.meshes.remove(mesh)
-        
-        # Remove orphaned lights
-        for light in bpy.data.lights:
-            if light.users == 0:
-                bpy.data.lights.remove(light)
+        # Remove orphaned meshes and lights in one batch
+        orphans = [mesh for mesh in bpy.data.meshes if mesh.users == 0]
+        orphans += [light for light in bpy.data.lights if light.users == 0]
+        if orphans:
+            bpy.data.batch_remove(ids=orphans)
         
-        # Remove orphaned materials
-        for material in bpy.data.materials:
-            if material.users == 0:
-                bpy.data.materials.remove(material)
+        # Remove orphaned materials, collected afterwards so materials only
+        # used by the removed meshes are included
+        orphans = [material for material in bpy.data.materials if material.users == 0]
+        if orphans:
+            bpy.data.batch_remove(ids=orphans)
                 
     except Exception as e:
         print(f"Warning: Error during orphaned data cleanup: {e}")
@@ -106,12 +115,17 @@ class UndoContext:
         self.initial_state = None
     
     def __enter__(self):
-        # Store initial state if needed
+        # No snapshot here: it costs a scan of the scene and __exit__ doesn't
+        # need it. Call capture_state() when one is wanted.
+        return self
+    
+    def capture_state(self):
+        """Snapshot object and collection names into initial_state"""
         self.initial_state = {
             'objects': set(bpy.data.objects.keys()),
             'collections': set(bpy.data.collections.keys())
         }
-        return self
+        return self.initial_state
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         if exc_type is None:
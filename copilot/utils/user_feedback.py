@@ -1,5 +1,10 @@
+import sys
+from enum import IntEnum
+
 import bpy
 
+from .validation import SUPPORTED_OBJECT_TYPES
+
 # Error message templates following Blender UI conventions
 ERROR_MESSAGES = {
     'NO_SELECTION': {
@@ -60,38 +65,67 @@ INFO_MESSAGES = {
     }
 }
 
+# Integer index for each ERROR_MESSAGES key, in definition order
+ErrKind = IntEnum('ErrKind', list(ERROR_MESSAGES), start=0)
+
+# (message, details, icon) per ErrKind, so reports index a tuple instead of
+# doing nested dict lookups
+_ERR_TABLE = tuple(
+    (info['message'], info['details'], info['icon'])
+    for info in ERROR_MESSAGES.values()
+)
+
+# String keys accepted by report_error for existing callers
+_ERR_NAME_TO_KIND = {kind.name: kind for kind in ErrKind}
+
+# Report and console text for the common no-context case, formatted once
+_ERROR_PREFORMATTED = tuple(
+    (f"{message}: {details}", f"COPILOT ERROR: {message}\nDETAILS: {details}\n")
+    for message, details, _icon in _ERR_TABLE
+)
+_SUCCESS_PREFORMATTED = {
+    key: (f"{info['message']}. {info['details']}",
+          f"COPILOT SUCCESS: {info['message']}\n")
+    for key, info in SUCCESS_MESSAGES.items()
+}
+_INFO_PREFORMATTED = {
+    key: f"{info['message']}: {info['details']}"
+    for key, info in INFO_MESSAGES.items()
+}
+
 def report_error(operator, error_type, context_info=None):
     """
     Report an error with consistent formatting and helpful details.
     
     Args:
         operator: Blender operator instance (has .report method)
-        error_type: Key from ERROR_MESSAGES
+        error_type: ErrKind member, or the matching key from ERROR_MESSAGES
         context_info: Optional dict with additional context
     """
-    if error_type not in ERROR_MESSAGES:
+    kind = _ERR_NAME_TO_KIND.get(error_type) if type(error_type) is str else error_type
+    if not isinstance(kind, int) or not 0 <= kind < len(_ERR_TABLE):
         operator.report({'ERROR'}, f"Unknown error: {error_type}")
         return
     
-    error_info = ERROR_MESSAGES[error_type]
-    message = error_info['message']
-    details = error_info['details']
+    if not context_info:
+        report_text, console_text = _ERROR_PREFORMATTED[kind]
+        operator.report({'ERROR'}, report_text)
+        sys.stdout.write(console_text)
+        return
+    
+    message, details, _icon = _ERR_TABLE[kind]
     
     # Add context-specific information
-    if context_info:
-        if 'object_type' in context_info:
-            details = details.format(object_type=context_info['object_type'])
-        elif 'object_name' in context_info:
-            details = details.format(object_name=context_info['object_name'])
+    if 'object_type' in context_info:
+        details = details.format(object_type=context_info['object_type'])
+    elif 'object_name' in context_info:
+        details = details.format(object_name=context_info['object_name'])
     
     # Report to user
     operator.report({'ERROR'}, f"{message}: {details}")
     
-    # Also print to console for debugging
-    print(f"COPILOT ERROR: {message}")
-    print(f"DETAILS: {details}")
-    if context_info:
-        print(f"CONTEXT: {context_info}")
+    # Also write to console for debugging, in one call
+    sys.stdout.write(f"COPILOT ERROR: {message}\nDETAILS: {details}\nCONTEXT: {context_info}\n")
 
 def report_success(operator, success_type, context_info=None):
     """
@@ -106,20 +140,24 @@ def report_success(operator, success_type, context_info=None):
         operator.report({'INFO'}, "Operation completed")
         return
     
+    if not context_info or 'object_name' not in context_info:
+        report_text, console_text = _SUCCESS_PREFORMATTED[success_type]
+        operator.report({'INFO'}, report_text)
+        sys.stdout.write(console_text)
+        return
+    
     success_info = SUCCESS_MESSAGES[success_type]
     message = success_info['message']
     details = success_info['details']
     
     # Add context-specific information
-    if context_info:
-        if 'object_name' in context_info:
-            message = f"{message} for '{context_info['object_name']}'"
+    message = f"{message} for '{context_info['object_name']}'"
     
     # Report to user
     operator.report({'INFO'}, f"{message}. {details}")
     
-    # Print to console
-    print(f"COPILOT SUCCESS: {message}")
+    # Write to console
+    sys.stdout.write(f"COPILOT SUCCESS: {message}\n")
 
 def report_info(operator, info_type, context_info=None):
     """
@@ -133,12 +171,15 @@ def report_info(operator, info_type, context_info=None):
     if info_type not in INFO_MESSAGES:
         return
     
+    if not context_info or 'object_name' not in context_info:
+        operator.report({'INFO'}, _INFO_PREFORMATTED[info_type])
+        return
+    
     info = INFO_MESSAGES[info_type]
     message = info['message']
     details = info['details']
     
-    if context_info and 'object_name' in context_info:
-        details = details.format(object_name=context_info['object_name'])
+    details = details.format(object_name=context_info['object_name'])
     
     operator.report({'INFO'}, f"{message}: {details}")
 
@@ -163,8 +204,7 @@ def get_context_error_message(context):
         return 'INVALID_MODE', {'current_mode': context.mode}
     
     # Check object type
-    valid_types = {'MESH', 'CURVE', 'SURFACE', 'META', 'FONT'}
-    if active_obj.type not in valid_types:
+    if active_obj.type not in SUPPORTED_OBJECT_TYPES:
         return 'INVALID_OBJECT_TYPE', {'object_type': active_obj.type}
     
     return None, None
@@ -1,5 +1,8 @@
 import bpy
 
+# Object types the lighting setup supports
+SUPPORTED_OBJECT_TYPES = frozenset(('MESH', 'CURVE', 'SURFACE', 'META', 'FONT'))
+
 def is_valid_selection(obj=None):
     """
     Check if there is a valid object selection.
@@ -25,8 +28,7 @@ def is_valid_object_type(obj_type):
     Returns:
         bool: True if object type is supported
     """
-    valid_types = {'MESH', 'CURVE', 'SURFACE', 'META', 'FONT'}
-    return obj_type in valid_types
+    return obj_type in SUPPORTED_OBJECT_TYPES
 
 def is_valid_mode(mode=None):
     """
@@ -53,20 +55,23 @@ def validate_target_object(obj=None):
     Returns:
         tuple: (is_valid: bool, error_message: str)
     """
+    context = bpy.context
     if obj is None:
-        obj = bpy.context.active_object
+        obj = context.active_object
     
     # Check if object exists
-    if not is_valid_selection(obj):
+    if obj is None:
         return False, "No object selected"
     
     # Check object type
-    if not is_valid_object_type(obj.type):
-        return False, f"Object type '{obj.type}' is not supported. Use MESH, CURVE, SURFACE, META, or FONT objects."
+    obj_type = obj.type
+    if obj_type not in SUPPORTED_OBJECT_TYPES:
+        return False, f"Object type '{obj_type}' is not supported. Use MESH, CURVE, SURFACE, META, or FONT objects."
     
     # Check mode
-    if not is_valid_mode():
-        return False, f"Must be in Object mode. Current mode: {bpy.context.mode}"
+    mode = context.mode
+    if mode != 'OBJECT':
+        return False, f"Must be in Object mode. Current mode: {mode}"
     
     return True, ""
 
@@ -50,21 +50,45 @@ def get_fixtures_dir():
 
 def clear_scene():
     """Delete all objects, meshes, materials, etc. from the current scene."""
-    # Delete all objects
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete(use_global=False)
-    
-    # Delete all mesh data
-    for mesh in bpy.data.meshes:
-        bpy.data.meshes.remove(mesh)
-    
-    # Delete all materials
-    for material in bpy.data.materials:
-        bpy.data.materials.remove(material)
-        
-    # Delete all curves
-    for curve in bpy.data.curves:
-        bpy.data.curves.remove(curve)
+    # Remove objects and their mesh, material and curve data in one batch,
+    # so references are swept once rather than per removal
+    bpy.data.batch_remove(ids=(
+        *bpy.data.objects,
+        *bpy.data.meshes,
+        *bpy.data.materials,
+        *bpy.data.curves,
+    ))
+
+
+# Unit cube matching primitive_cube_add(size=2): vertices at +/-1, outward quads
+_CUBE_VERTS = (
+    (-1, -1, -1), (-1, -1, 1), (-1, 1, -1), (-1, 1, 1),
+    (1, -1, -1), (1, -1, 1), (1, 1, -1), (1, 1, 1),
+)
+_CUBE_FACES = (
+    (0, 1, 3, 2), (2, 3, 7, 6), (6, 7, 5, 4),
+    (4, 5, 1, 0), (2, 6, 4, 0), (7, 3, 1, 5),
+)
+
+
+def _link_object(obj):
+    """Link an object to the active collection and make it the selected, active object."""
+    bpy.context.collection.objects.link(obj)
+    obj.select_set(True)
+    bpy.context.view_layer.objects.active = obj
+    return obj
+
+
+def _make_cube(name, location, scale=(1, 1, 1)):
+    """Build a cube object from mesh data, without going through an operator."""
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(_CUBE_VERTS, (), _CUBE_FACES)
+    mesh.update()
+    
+    cube = bpy.data.objects.new(name, mesh)
+    cube.location = location
+    cube.scale = scale
+    return _link_object(cube)
 
 
 def create_single_cube():
@@ -72,9 +96,7 @@ def create_single_cube():
     clear_scene()
     
     # Add cube at origin
-    bpy.ops.mesh.primitive_cube_add(location=(0, 0, 0))
-    cube = bpy.context.active_object
-    cube.name = "TestCube"
+    _make_cube("TestCube", (0, 0, 0))
     
     return "single_cube.blend"
 
@@ -84,17 +106,16 @@ def create_cube_and_empty():
     clear_scene()
     
     # Add cube
-    bpy.ops.mesh.primitive_cube_add(location=(0, 0, 0))
-    cube = bpy.context.active_object
-    cube.name = "TestCube"
+    cube = _make_cube("TestCube", (0, 0, 0))
     
     # Deselect cube
     cube.select_set(False)
     
     # Add empty
-    bpy.ops.object.empty_add(type='PLAIN_AXES', location=(2, 0, 0))
-    empty = bpy.context.active_object
-    empty.name = "ArrayController"
+    empty = bpy.data.objects.new("ArrayController", None)
+    empty.empty_display_type = 'PLAIN_AXES'
+    empty.location = (2, 0, 0)
+    _link_object(empty)
     
     return "cube_and_empty.blend"
 
@@ -104,28 +125,30 @@ def create_cube_and_curve():
     clear_scene()
     
     # Add cube
-    bpy.ops.mesh.primitive_cube_add(location=(0, 0, 0))
-    cube = bpy.context.active_object
-    cube.name = "TestCube"
+    cube = _make_cube("TestCube", (0, 0, 0))
     
     # Deselect cube
     cube.select_set(False)
     
-    # Add bezier curve
-    bpy.ops.curve.primitive_bezier_curve_add(location=(0, 0, 0))
-    curve = bpy.context.active_object
-    curve.name = "DeformPath"
-    
-    # Modify curve to create a simple path
-    # Curve should have some curvature for testing deformation
-    curve_data = curve.data
-    if len(curve_data.splines) > 0:
-        spline = curve_data.splines[0]
-        if len(spline.bezier_points) >= 2:
-            # Move second point to create a curve
-            spline.bezier_points[1].co = (3, 2, 0)
-            spline.bezier_points[1].handle_left = (2, 1, 0)
-            spline.bezier_points[1].handle_right = (4, 3, 0)
+    # Add bezier curve with the same first point primitive_bezier_curve_add creates
+    curve_data = bpy.data.curves.new("DeformPath", type='CURVE')
+    curve_data.dimensions = '3D'
+    spline = curve_data.splines.new('BEZIER')
+    spline.bezier_points.add(1)
+    
+    start = spline.bezier_points[0]
+    start.co = (-1, 0, 0)
+    start.handle_left = (-1.5, -0.5, 0)
+    start.handle_right = (-0.5, 0.5, 0)
+    
+    # Second point is moved out to give the path some curvature for
+    # testing deformation
+    end = spline.bezier_points[1]
+    end.co = (3, 2, 0)
+    end.handle_left = (2, 1, 0)
+    end.handle_right = (4, 3, 0)
+    
+    _link_object(bpy.data.objects.new("DeformPath", curve_data))
     
     return "cube_and_curve.blend"
 
@@ -135,20 +158,14 @@ def create_two_cubes():
     clear_scene()
     
     # Add first cube (will be source for shrinkwrap)
-    bpy.ops.mesh.primitive_cube_add(location=(-1.5, 0, 0))
-    cube1 = bpy.context.active_object
-    cube1.name = "SourceCube"
+    cube1 = _make_cube("SourceCube", (-1.5, 0, 0))
     
     # Deselect first cube
     cube1.select_set(False)
     
-    # Add second cube (will be target for shrinkwrap)
-    bpy.ops.mesh.primitive_cube_add(location=(1.5, 0, 0))
-    cube2 = bpy.context.active_object
-    cube2.name = "TargetCube"
-    
-    # Scale second cube to make it bigger (better for shrinkwrap testing)
-    cube2.scale = (1.5, 1.5, 1.5)
+    # Add second cube (will be target for shrinkwrap), scaled up to make it
+    # bigger (better for shrinkwrap testing)
+    _make_cube("TargetCube", (1.5, 0, 0), scale=(1.5, 1.5, 1.5))
     
     return "two_cubes.blend"
 
@@ -176,9 +193,13 @@ def main():
         # Create the scene
         actual_filename = create_func()
         
-        # Save the file
+        # Write only the scene and the data it uses; save_as_mainfile would
+        # also serialize the session's UI and window state. No fake users,
+        # so loaded IDs keep the same user counts as a normal save.
         filepath = fixtures_dir / actual_filename
-        bpy.ops.wm.save_as_mainfile(filepath=str(filepath))
+        bpy.data.libraries.write(
+            str(filepath), {bpy.context.scene}, fake_user=False, compress=True
+        )
         
         print(f"  ✓ Saved to: {filepath}")
         created_files.append(filepath)
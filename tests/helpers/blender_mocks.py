@@ -5,6 +5,9 @@ This module provides mock classes and utilities for testing Blender add-on code
 without requiring a full Blender instance.
 """
 
+import copy
+import sys
+from collections import Counter
 from typing import List, Optional, Dict, Any
 from unittest.mock import MagicMock
 
@@ -13,8 +16,10 @@ class MockModifier:
     """Mock Blender modifier object."""
     
     def __init__(self, name: str, type: str):
-        self.name = name
-        self.type = type
+        # Interned so type/name comparisons against literals hit the
+        # identity fast path
+        self.name = sys.intern(name)
+        self.type = sys.intern(type)
         # Common modifier properties
         self.show_viewport = True
         self.show_render = True
@@ -28,30 +33,44 @@ class MockModifierList:
     
     def __init__(self):
         self._modifiers: List[MockModifier] = []
+        # Name index; holds the first modifier with each name, like a scan would
+        self._by_name: Dict[str, MockModifier] = {}
     
     def new(self, name: str, type: str) -> MockModifier:
         """Add a new modifier to the object."""
         modifier = MockModifier(name, type)
         self._modifiers.append(modifier)
+        self._by_name.setdefault(modifier.name, modifier)
         return modifier
     
     def remove(self, modifier: MockModifier):
         """Remove a modifier from the object."""
         self._modifiers.remove(modifier)
+        if self._by_name.get(modifier.name) is modifier:
+            del self._by_name[modifier.name]
+            # Re-index a remaining modifier with the same name, if any
+            for mod in self._modifiers:
+                if mod.name == modifier.name:
+                    self._by_name[mod.name] = mod
+                    break
     
     def clear(self):
         """Remove all modifiers."""
         self._modifiers.clear()
+        self._by_name.clear()
     
     def __getitem__(self, key):
         """Get modifier by name or index."""
         if isinstance(key, int):
             return self._modifiers[key]
-        # Find by name
-        for mod in self._modifiers:
-            if mod.name == key:
-                return mod
-        raise KeyError(f"Modifier '{key}' not found")
+        try:
+            return self._by_name[key]
+        except KeyError:
+            raise KeyError(f"Modifier '{key}' not found") from None
+    
+    def __contains__(self, name) -> bool:
+        """Check whether a modifier with this name exists."""
+        return name in self._by_name
     
     def __len__(self):
         return len(self._modifiers)
@@ -60,23 +79,78 @@ class MockModifierList:
         return iter(self._modifiers)
 
 
+class _NullStub:
+    """Stub-only stand-in for MagicMock that records nothing.
+
+    Any attribute access or call returns the stub itself, attribute
+    assignment is ignored, and it behaves as an empty sized collection.
+    """
+    
+    __slots__ = ()
+    
+    def __getattr__(self, name):
+        return self
+    
+    def __setattr__(self, name, value):
+        pass
+    
+    def __call__(self, *args, **kwargs):
+        return self
+    
+    def __len__(self):
+        return 0
+    
+    def __iter__(self):
+        return iter(())
+    
+    def __repr__(self):
+        return "<NullStub>"
+
+
+_SHARED_STUB = _NullStub()
+
+
 class MockObject:
-    """Mock Blender object."""
+    """Mock Blender object.
     
-    def __init__(self, name: str, obj_type: str = 'MESH'):
+    data and select_set are a shared stub that records nothing; pass
+    heavy_mocks=True for MagicMock fields when a test asserts on calls.
+    """
+    
+    def __init__(self, name: str, obj_type: str = 'MESH', heavy_mocks: bool = False):
         self.name = name
-        self.type = obj_type
+        self.type = sys.intern(obj_type)
         self.modifiers = MockModifierList()
         self.location = (0.0, 0.0, 0.0)
         self.rotation_euler = (0.0, 0.0, 0.0)
         self.scale = (1.0, 1.0, 1.0)
-        self.data = MagicMock()  # Mock mesh/curve data
-        self.select_set = MagicMock()
+        if heavy_mocks:
+            self.data = MagicMock()  # Mock mesh/curve data
+            self.select_set = MagicMock()
+        else:
+            self.data = _SHARED_STUB
+            self.select_set = _SHARED_STUB
         
     def __repr__(self):
         return f"MockObject(name='{self.name}', type='{self.type}')"
 
 
+# Pre-built objects per type; create_mock_scene shallow-copies these instead
+# of building fresh MagicMock fields for every object
+_PROTOTYPES = {
+    obj_type: MockObject('_proto', obj_type)
+    for obj_type in ('MESH', 'EMPTY', 'CURVE')
+}
+
+
+def _clone_prototype(name: str, obj_type: str) -> MockObject:
+    """Shallow-copy a prototype object with its own name and modifier list."""
+    obj = copy.copy(_PROTOTYPES[obj_type])
+    obj.name = name
+    obj.modifiers = MockModifierList()
+    return obj
+
+
 class MockBlenderContext:
     """Mock Blender context (mimics bpy.context)."""
     
@@ -93,6 +167,47 @@ class MockBlenderContext:
                 f"mode='{self.mode}')")
 
 
+class MockID:
+    """Mock ID datablock with a fixed as_pointer() value."""
+    
+    def __init__(self, pointer: int):
+        self.pointer = pointer
+    
+    def as_pointer(self) -> int:
+        return self.pointer
+
+
+# World matrix and local bound box of an untransformed unit cube at the origin
+IDENTITY_MATRIX = ((1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0), (0, 0, 0, 1))
+UNIT_CUBE_BOUND_BOX = [(x, y, z) for x in (0, 1) for y in (0, 1) for z in (0, 1)]
+
+
+class MockBoundBox(list):
+    """Mock bound_box (bpy_prop_array of 8 x 3 floats).
+    
+    foreach_get fills a flat buffer in corner order, as RNA does for
+    multi-dimensional arrays.
+    """
+    
+    def foreach_get(self, seq):
+        seq[:] = [value for corner in self for value in corner]
+
+
+class MockBoundsObject(MockID):
+    """Mock object for bounding box utilities.
+    
+    Provides bound_box, matrix_world, data and as_pointer(); the data
+    pointer defaults to the object pointer + 1.
+    """
+    
+    def __init__(self, pointer: int = 1, matrix_world=IDENTITY_MATRIX,
+                 bound_box=UNIT_CUBE_BOUND_BOX, data_pointer: Optional[int] = None):
+        super().__init__(pointer)
+        self.matrix_world = matrix_world
+        self.bound_box = bound_box
+        self.data = MockID(pointer + 1 if data_pointer is None else data_pointer)
+
+
 def create_mock_scene(
     num_meshes: int = 0,
     num_empties: int = 0,
@@ -102,6 +217,10 @@ def create_mock_scene(
     """
     Create a mock Blender scene with specified objects.
     
+    Objects are cloned from per-type prototypes and use the shared
+    record-nothing stub for data and select_set; build a MockObject with
+    heavy_mocks=True when a test needs to assert on those.
+    
     Args:
         num_meshes: Number of mesh objects to create
         num_empties: Number of empty objects to create
@@ -115,17 +234,17 @@ def create_mock_scene(
     
     # Create mesh objects
     for i in range(num_meshes):
-        obj = MockObject(f"Mesh{i+1}", 'MESH')
+        obj = _clone_prototype(f"Mesh{i+1}", 'MESH')
         context.selected_objects.append(obj)
     
     # Create empty objects
     for i in range(num_empties):
-        obj = MockObject(f"Empty{i+1}", 'EMPTY')
+        obj = _clone_prototype(f"Empty{i+1}", 'EMPTY')
         context.selected_objects.append(obj)
     
     # Create curve objects
     for i in range(num_curves):
-        obj = MockObject(f"Curve{i+1}", 'CURVE')
+        obj = _clone_prototype(f"Curve{i+1}", 'CURVE')
         context.selected_objects.append(obj)
     
     # Set active object
@@ -149,9 +268,8 @@ def assert_modifier_exists(obj: MockObject, modifier_name: str) -> bool:
     Raises:
         AssertionError: If modifier not found
     """
-    modifier_names = [mod.name for mod in obj.modifiers]
-    assert modifier_name in modifier_names, \
-        f"Modifier '{modifier_name}' not found. Available: {modifier_names}"
+    assert modifier_name in obj.modifiers, \
+        f"Modifier '{modifier_name}' not found. Available: {[mod.name for mod in obj.modifiers]}"
     return True
 
 
@@ -191,9 +309,14 @@ def assert_modifier_order(obj: MockObject, expected_order: List[str]) -> bool:
     Raises:
         AssertionError: If order doesn't match
     """
-    actual_order = [mod.name for mod in obj.modifiers]
-    assert actual_order == expected_order, \
-        f"Modifier order mismatch. Expected: {expected_order}, Got: {actual_order}"
+    # Compare in place and stop at the first mismatch; the actual order is
+    # only listed when the assertion fails
+    modifiers = obj.modifiers
+    in_order = len(modifiers) == len(expected_order) and all(
+        mod.name == name for mod, name in zip(modifiers, expected_order)
+    )
+    assert in_order, \
+        f"Modifier order mismatch. Expected: {expected_order}, Got: {[mod.name for mod in modifiers]}"
     return True
 
 
@@ -207,10 +330,7 @@ def get_object_type_counts(context: MockBlenderContext) -> Dict[str, int]:
     Returns:
         Dictionary mapping object type to count (e.g., {'MESH': 2, 'EMPTY': 1})
     """
-    type_counts: Dict[str, int] = {}
-    for obj in context.selected_objects:
-        type_counts[obj.type] = type_counts.get(obj.type, 0) + 1
-    return type_counts
+    return dict(Counter(obj.type for obj in context.selected_objects))
 
 
 # Example usage for testing
@@ -6,6 +6,8 @@ This module handles Blender add-on registration for tests that need it.
 import sys
 from pathlib import Path
 
+import pytest
+
 # Import Blender
 import bpy  # noqa: F401
 
@@ -15,6 +17,13 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 
+@pytest.fixture(scope="session")
+def parse_command():
+    """Command parser, imported once per test session."""
+    from copilot.utils.command_parser import parse_command
+    return parse_command
+
+
 def pytest_sessionstart(session):
     """Called before test session starts - register scene property."""
     # Register the copilot_modifier_command property directly
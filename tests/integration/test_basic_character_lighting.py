@@ -1,30 +1,54 @@
 import bpy
-import unittest
+import pytest
 
-class TestBasicCharacterLighting(unittest.TestCase):
-    def setUp(self):
-        # Setup: create a mesh object and set as active
-        mesh = bpy.data.meshes.new('TestMesh')
-        obj = bpy.data.objects.new('TestCharacter', mesh)
-        bpy.context.collection.objects.link(obj)
-        bpy.context.view_layer.objects.active = obj
-        bpy.context.view_layer.update()
 
+@pytest.fixture(scope="class", autouse=True)
+def character(request):
+    # Setup: create a mesh object and set as active, once per class
+    mesh = bpy.data.meshes.new('TestMesh')
+    obj = bpy.data.objects.new('TestCharacter', mesh)
+    bpy.context.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+    bpy.context.view_layer.update()
+    request.cls.character = obj
+    yield obj
+    bpy.data.objects.remove(obj)
+    bpy.data.meshes.remove(mesh)
+
+
+@pytest.fixture(autouse=True)
+def remove_rig(character):
+    # Teardown: remove only objects, light data and collections added during
+    # the test, keeping the character and any pre-existing scene content
+    objects_before = set(bpy.data.objects.keys())
+    lights_before = set(bpy.data.lights.keys())
+    collections_before = set(bpy.data.collections.keys())
+    yield
+    rig = [obj for obj in bpy.data.objects if obj.name not in objects_before]
+    rig += [light for light in bpy.data.lights if light.name not in lights_before]
+    rig += [coll for coll in bpy.data.collections if coll.name not in collections_before]
+    if rig:
+        bpy.data.batch_remove(ids=rig)
+    bpy.context.view_layer.objects.active = character
+
+
+class TestBasicCharacterLighting:
     def test_lighting_rig_creation(self):
         # Execute operator
         result = bpy.ops.copilot.create_three_point_lighting()
-        self.assertIn(result, [{'FINISHED'}, {'CANCELLED'}])
+        assert result in [{'FINISHED'}, {'CANCELLED'}]
         # Validate rig: 3 lights, 1 empty, 1 collection
         lights = [obj for obj in bpy.context.collection.objects if obj.type == 'LIGHT']
         empties = [obj for obj in bpy.context.collection.objects if obj.type == 'EMPTY']
-        self.assertEqual(len(lights), 3)
-        self.assertEqual(len(empties), 1)
+        assert len(lights) == 3
+        assert len(empties) == 1
         # Check collection
-        self.assertTrue(any(coll.name.startswith('ThreePointRig') for coll in bpy.data.collections))
+        assert any(coll.name.startswith('ThreePointRig') for coll in bpy.data.collections)
         # Check Track To constraints
         for light in lights:
             constraints = [c for c in light.constraints if c.type == 'TRACK_TO']
-            self.assertTrue(len(constraints) > 0)
+            assert len(constraints) > 0
+
 
 if __name__ == "__main__":
-    unittest.main()
+    pytest.main([__file__])
@@ -178,6 +178,21 @@ class TestPriorityAndAmbiguity:
         assert parse_command("hard-surface") == 'HARD_SURFACE'
 
 
+class TestParserCache:
+    """Test that repeated commands are served from the parser cache."""
+    
+    def test_repeated_command_hits_cache(self):
+        """Test identical command strings reuse the memoized result."""
+        parse_command.cache_clear()
+        assert parse_command("make array") == 'SMART_ARRAY'
+        assert parse_command("make array") == 'SMART_ARRAY'
+        assert parse_command.cache_info().hits == 1
+    
+    def test_priority_preserved(self):
+        """Test workflow priority does not depend on keyword position."""
+        assert parse_command("mirror the array") == 'SMART_ARRAY'
+
+
 class TestParserPerformance:
     """Test that parsing is fast enough (<10ms per contract)."""
     
@@ -1,5 +1,15 @@
+import sys
 import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
 import copilot.utils.geometry as geometry
+from tests.helpers.blender_mocks import MockBoundBox, MockBoundsObject, MockID
 
 class TestGeometryUtils(unittest.TestCase):
     def test_spherical_to_cartesian(self):
@@ -15,6 +25,48 @@ class TestGeometryUtils(unittest.TestCase):
         result = geometry.analyze_bounding_box(bbox)
         self.assertIsInstance(result, dict)
 
+    def test_bounding_box_cache_hit(self):
+        geometry.clear_bounding_box_cache()
+        obj = MockBoundsObject()
+        with patch.object(geometry, '_compute_bounding_box',
+                          wraps=geometry._compute_bounding_box) as compute:
+            first = geometry.analyze_bounding_box(obj)
+            second = geometry.analyze_bounding_box(obj)
+        self.assertEqual(compute.call_count, 1)
+        self.assertAlmostEqual(first['radius'], second['radius'])
+        self.assertAlmostEqual(first['radius'], 3**0.5 / 2)
+
+    def test_read_bound_box_flat_buffer(self):
+        import numpy as np
+        # Distinct values per corner and axis, so any reordering shows up
+        corners = [(i, i + 0.25, i + 0.5) for i in range(8)]
+        obj = MockBoundsObject(bound_box=MockBoundBox(corners))
+        result = geometry._read_bound_box(obj, np)
+        self.assertEqual(result.shape, (8, 3))
+        self.assertEqual(result.tolist(), [list(corner) for corner in corners])
+
+    def test_geometry_update_drops_only_updated_object(self):
+        geometry.clear_bounding_box_cache()
+        other = MockBoundsObject(pointer=3)
+        geometry.analyze_bounding_box(MockBoundsObject())
+        geometry.analyze_bounding_box(other)
+        
+        # Geometry update on the first object's mesh data (pointer 2)
+        mesh = SimpleNamespace(original=MockID(2))
+        depsgraph = SimpleNamespace(updates=[SimpleNamespace(id=mesh, is_updated_geometry=True)])
+        geometry._on_depsgraph_update(None, depsgraph)
+        
+        self.assertEqual([key[0] for key in geometry._BBOX_CACHE], [3])
+
+    def test_precomputed_trig_matches_scalar(self):
+        from copilot.utils.light_defaults import LIGHT_DEFAULTS
+        for config in LIGHT_DEFAULTS.values():
+            expected = geometry.spherical_to_cartesian(
+                2.0, config.horizontal_angle, config.vertical_angle)
+            result = geometry.spherical_to_cartesian_precomputed(2.0, config.trig)
+            for axis in range(3):
+                self.assertAlmostEqual(result[axis], expected[axis])
+
     def test_distance_calculation(self):
         # Stub: distance calculation
         result = geometry.calculate_distance((0,0,0), (1,1,1))